@@ -1,9 +1,10 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import IllustrationJob
+from .models import IllustrationJob, StoryVisualBrief
 
 admin.site.register(IllustrationJob)
+admin.site.register(StoryVisualBrief)
 class IllustrationJobAdmin(admin.ModelAdmin):
     list_display = ("id", "story", "status", "total_pages", "completed_pages", "created_at")
     list_filter = ("status",)
@@ -1,6 +1,9 @@
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from channels.db import database_sync_to_async
-from .models import ChatRoom, Message
+from .models import ChatRoom, Message, IllustrationJob
+from .serializers import IllustrationJobSerializer
+from .services.illustration_service import job_group_name
+from story.services.ingest_service import ingest_story
 from story.models import *
 from django.conf import settings
 import os, asyncio, json
@@ -182,30 +185,21 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
     @database_sync_to_async
     def create_extended_story(self, base_story, user, extended_text):
         full_content = (base_story.content or "") + "\n" + extended_text
-        new_story = Story.objects.create(
+        sentences = [s.strip() for s in full_content.split("\n") if s.strip()]
+
+        # 원본 동화의 교훈을 그대로 이어받음
+        return ingest_story(
+            sentences,
+            moral_themes=base_story.morals.all(),
             user=user,
             child=base_story.child,
             voice=base_story.voice,
             title=f"{base_story.title} - 확장편",
             content=full_content.strip(),
-            page_count=0,
             age_group=base_story.age_group,
-            moral=base_story.moral,
-            status="extended",
             category="extended",
         )
 
-        sentences = [s.strip() for s in full_content.split("\n") if s.strip()]
-        for i, sentence in enumerate(sentences, start=1):
-            StoryPage.objects.create(
-                story=new_story,
-                page_number=i,
-                text=sentence
-            )
-        new_story.page_count = len(sentences)
-        new_story.save()
-        return new_story
-
     async def ending_extension(self, room: ChatRoom):
         messages = await self.get_all_messages(room)
         conversation_text = "\n".join([f"{m.sender}:{m.text}" for m in messages])
@@ -386,4 +380,85 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
 
     @database_sync_to_async
     def check_room_exists(self, room_id):
-        return ChatRoom.objects.filter(id=room_id).exists()
\ No newline at end of file
+        return ChatRoom.objects.filter(id=room_id).exists()
+
+
+class IllustrationJobConsumer(AsyncJsonWebsocketConsumer):
+    """
+    IllustrationJob 진행 상황을 페이지 단위로 push (폴링 대체)
+    ws/illustration/jobs/<job_id>/
+    """
+    async def connect(self):
+        try:
+            headers = dict(self.scope['headers'])
+            auth_header = headers.get(b'authorization')
+
+            if not auth_header:
+                raise ValueError("인증 헤더 없음")
+
+            token_str = auth_header.decode().split(" ")[1]
+            token = AccessToken(token_str)
+            self.scope['user'] = await self.get_user_from_token(token['user_id'])
+
+            self.job_id = self.scope['url_route']['kwargs']['job_id']
+            self.group_name = job_group_name(self.job_id)
+
+            # 스냅샷 조회 전에 그룹에 먼저 참여해야 그 사이 완료된 페이지 이벤트를 놓치지 않음
+            await self.channel_layer.group_add(self.group_name, self.channel_name)
+
+            # 본인 동화의 job만 구독 가능
+            job = await self.get_job_snapshot(self.job_id, self.scope['user'])
+            if job is None:
+                raise ValueError("작업 없음")
+
+            await self.accept()
+            await self.send_json({"type": "snapshot", "job": job})
+
+        except ValueError as e:
+            await self.reject_connection(str(e))
+
+        except Exception as e:
+            # 만료/위조 토큰(TokenError), 잘못된 헤더 형식 등
+            await self.reject_connection(f"인증 오류: {str(e)}")
+
+    async def reject_connection(self, message):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+        await self.send_json({'error_message': message})
+        await self.close()
+
+    async def disconnect(self, close_code):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def illustration_page_done(self, event):
+        await self.send_json({
+            "type": "page_done",
+            "job_id": event["job_id"],
+            "page_number": event["page_number"],
+            "illustration_id": event["illustration_id"],
+            "image_url": event["image_url"],
+            "image_srcset": event.get("image_srcset", {}),
+            "completed_pages": event["completed_pages"],
+        })
+
+    async def illustration_job_done(self, event):
+        await self.send_json({
+            "type": "job_done",
+            "job_id": event["job_id"],
+            "status": event["status"],
+            "total_pages": event.get("total_pages"),
+            "completed_pages": event.get("completed_pages"),
+            "error_message": event.get("error_message", ""),
+        })
+
+    @database_sync_to_async
+    def get_job_snapshot(self, job_id, user):
+        job = IllustrationJob.objects.select_related("story").filter(id=job_id, story__user=user).first()
+        if job is None:
+            return None
+        return IllustrationJobSerializer(job).data
+
+    @database_sync_to_async
+    def get_user_from_token(self, user_id):
+        return User.objects.get(id=user_id)
@@ -0,0 +1,24 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from AI.models import IllustrationJob
+
+
+class Command(BaseCommand):
+    help = "워커 재시작 등으로 PENDING/RUNNING에 멈춘 오래된 삽화 job을 FAILED로 정리"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--minutes", type=int, default=60, help="생성 후 이 시간이 지난 미완료 job을 정리")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options["minutes"])
+        updated = IllustrationJob.objects.filter(
+            status__in=["PENDING", "RUNNING"],
+            created_at__lt=cutoff,
+        ).update(
+            status="FAILED",
+            error_message="작업이 중단되었습니다. (워커 재시작)",
+            finished_at=timezone.now(),
+        )
+        self.stdout.write(f"{updated}개의 삽화 job을 FAILED로 변경했습니다.")
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AI', '0002_initial'),
+        ('story', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoryVisualBrief',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text_hash', models.CharField(max_length=64)),
+                ('brief', models.TextField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('story', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='visual_brief', to='story.story')),
+            ],
+        ),
+    ]
@@ -18,6 +18,17 @@ class IllustrationJob(models.Model):
     def __str__(self):
         return f"Illustrations for {self.story.title} ({self.status})"
 
+class StoryVisualBrief(models.Model):
+    # 삽화 프롬프트에 공통으로 들어가는 동화 단위 시각 설정 (등장인물, 배경, 색감)
+    story = models.OneToOneField(Story, on_delete=models.CASCADE, related_name="visual_brief")
+    text_hash = models.CharField(max_length=64)  # 페이지 텍스트 sha256, 바뀌면 재생성
+    brief = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Visual brief for {self.story.title}"
+
 class ChatRoom(models.Model):
     story = models.ForeignKey(Story, on_delete=models.CASCADE, related_name="chatrooms")
 
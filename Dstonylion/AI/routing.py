@@ -4,4 +4,5 @@ from AI import consumers
 
 websocket_urlpatterns = [
     path("ws/room/<int:room_id>/messages/", consumers.ChatConsumer.as_asgi()),
+    path("ws/illustration/jobs/<int:job_id>/", consumers.IllustrationJobConsumer.as_asgi()),
 ]
\ No newline at end of file
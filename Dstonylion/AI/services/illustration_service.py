@@ -0,0 +1,230 @@
+import os, re, hashlib, traceback
+from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from dotenv import load_dotenv
+from openai import OpenAI
+
+from story.models import Illustrations
+from story.services.image_service import ingest_b64_image, variant_urls
+from AI.models import IllustrationJob, StoryVisualBrief
+
+load_dotenv(settings.BASE_DIR / ".env")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+client = OpenAI(api_key=OPENAI_API_KEY)
+
+SAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
+# 동화 단위 작업을 요청 스레드 밖에서 돌리는 풀
+# 작업은 이 프로세스 메모리에만 있으므로 워커가 재시작되면 PENDING/RUNNING으로 남은 job은 이어서 실행되지 않음
+# → python manage.py fail_stale_illustration_jobs 로 오래된 job을 FAILED 처리
+_job_executor = ThreadPoolExecutor(
+    max_workers=settings.ILLUSTRATION_JOB_WORKERS,
+    thread_name_prefix="illustration-job",
+)
+# 페이지 단위 이미지 생성 풀 (노드 전체의 동시 생성 개수 상한)
+_page_executor = ThreadPoolExecutor(
+    max_workers=settings.ILLUSTRATION_PAGE_CONCURRENCY,
+    thread_name_prefix="illustration-page",
+)
+
+
+def safe_filename(s: str) -> str:
+    return SAFE_FILENAME_RE.sub("_", s.strip())[:80] or "story"
+
+
+def job_group_name(job_id):
+    return f"illustration_job_{job_id}"
+
+
+def notify_job_event(job_id, event):
+    """
+    job 그룹을 구독 중인 WebSocket 클라이언트에게 진행 이벤트 전송
+    """
+    try:
+        channel_layer = get_channel_layer()
+        if channel_layer is not None:
+            async_to_sync(channel_layer.group_send)(job_group_name(job_id), event)
+    except Exception as e:
+        # 알림 실패가 삽화 생성 자체를 실패시키지 않도록 함
+        print("IllustrationJob 알림 실패:", e)
+
+
+def enqueue_illustration_job(job_id):
+    """
+    삽화 생성 작업을 백그라운드 풀에 등록 (트랜잭션 커밋 이후 실행)
+    """
+    transaction.on_commit(lambda: _job_executor.submit(run_illustration_job, job_id))
+
+
+def pages_text_hash(pages):
+    joined = "\n".join(f"{p.page_number}:{p.text}" for p in pages)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def get_visual_brief(story, pages):
+    """
+    동화 단위 시각 설정(등장인물, 배경, 색감)을 한 번만 만들어 재사용
+    페이지 텍스트 해시가 바뀐 경우에만 다시 생성
+    """
+    text_hash = pages_text_hash(pages)
+    cached = StoryVisualBrief.objects.filter(story=story).first()
+    if cached and cached.text_hash == text_hash:
+        return cached.brief
+
+    story_text = "\n".join([f"Page {p.page_number}: {p.text}" for p in pages])
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{
+            "role": "user",
+            "content": (
+                "Read the children's story below and write a compact visual brief for its illustrator. "
+                "Describe only: main characters (appearance, clothing, colors), setting, "
+                "and a color palette / art style that every page should share. "
+                "Use at most 120 words and no page-by-page summary.\n\n"
+                f"{story_text}"
+            ),
+        }],
+    )
+    brief = response.choices[0].message.content.strip()
+
+    StoryVisualBrief.objects.update_or_create(
+        story=story,
+        defaults={"text_hash": text_hash, "brief": brief, "updated_at": timezone.now()},
+    )
+    return brief
+
+
+def build_page_prompt(visual_brief, page, is_first, is_last):
+    brief_block = f"Visual brief shared by every page of this story:\n{visual_brief}\n\n"
+    if is_first:
+        return (
+            "You are illustrating a children's storybook. "
+            "Keep the characters, setting and palette consistent with the brief below.\n\n"
+            f"{brief_block}"
+            f"Now create an illustration for the *first page*:\n{page.text}"
+        )
+    if is_last:
+        return (
+            "Following the same visual brief to ensure consistency, "
+            "create an illustration for the *final page* of the story. The style of illustration should be similar with the intro page.\n\n"
+            f"{brief_block}"
+            f"Focus on emotional or narrative closure based on this last page:\n{page.text}"
+        )
+    return (
+        "Following the same visual brief to ensure consistency, "
+        f"create an illustration for *page {page.page_number}* of the story. The style of illustration should be similar with the intro page.\n\n"
+        f"{brief_block}"
+        f"Illustrate this page:\n{page.text}"
+    )
+
+
+def render_page_illustration(job_id, page, prompt, safe_title):
+    """
+    한 페이지 삽화를 생성해 S3에 저장하고 job 진행도를 갱신
+    """
+    close_old_connections()
+    try:
+        result = client.images.generate(
+            model="gpt-image-1",
+            prompt=prompt,
+            size="1536x1024"
+        )
+        filename = f"{safe_title}_p{page.page_number}_{uuid4().hex[:8]}.png"
+        s3_path, variants = ingest_b64_image(filename, result.data[0].b64_json)
+        del result  # 응답의 base64 문자열을 바로 해제
+
+        illustration = Illustrations.objects.create(
+            story_page=page,
+            image=s3_path,
+            variants=variants,
+            prompt=prompt,
+            style="default"
+        )
+        IllustrationJob.objects.filter(id=job_id).update(completed_pages=F("completed_pages") + 1)
+        completed_pages = IllustrationJob.objects.filter(id=job_id).values_list("completed_pages", flat=True).first()
+
+        notify_job_event(job_id, {
+            "type": "illustration_page_done",
+            "job_id": job_id,
+            "page_number": page.page_number,
+            "illustration_id": illustration.id,
+            "image_url": default_storage.url(s3_path),
+            "image_srcset": variant_urls(variants),
+            "completed_pages": completed_pages,
+        })
+        return illustration
+    finally:
+        close_old_connections()
+
+
+def run_illustration_job(job_id):
+    close_old_connections()
+    try:
+        job = IllustrationJob.objects.select_related("story").get(id=job_id)
+        pages = list(job.story.pages.all().order_by("page_number"))
+
+        job.status = "RUNNING"
+        job.total_pages = len(pages)
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "total_pages", "started_at"])
+
+        # 전체 본문 대신 동화 단위 시각 설정만 각 페이지 prompt에 포함
+        visual_brief = get_visual_brief(job.story, pages)
+        safe_title = safe_filename(job.story.title)
+
+        futures = [
+            _page_executor.submit(
+                render_page_illustration,
+                job_id,
+                page,
+                build_page_prompt(visual_brief, page, i == 0, i == len(pages) - 1),
+                safe_title,
+            )
+            for i, page in enumerate(pages)
+        ]
+
+        errors = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                traceback.print_exc()
+                errors.append(str(e))
+
+        job.refresh_from_db(fields=["completed_pages"])
+        job.status = "FAILED" if errors else "SUCCESS"
+        job.error_message = "\n".join(errors)
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error_message", "finished_at"])
+
+        notify_job_event(job_id, {
+            "type": "illustration_job_done",
+            "job_id": job_id,
+            "status": job.status,
+            "total_pages": job.total_pages,
+            "completed_pages": job.completed_pages,
+            "error_message": job.error_message,
+        })
+
+    except Exception as e:
+        traceback.print_exc()
+        IllustrationJob.objects.filter(id=job_id).update(
+            status="FAILED",
+            error_message=str(e),
+            finished_at=timezone.now(),
+        )
+        notify_job_event(job_id, {
+            "type": "illustration_job_done",
+            "job_id": job_id,
+            "status": "FAILED",
+            "error_message": str(e),
+        })
+    finally:
+        close_old_connections()
@@ -3,6 +3,7 @@ from .views import *
 
 urlpatterns = [
     path("illustration/generate/", GenerateIllustrationsView.as_view()),
+    path("illustration/jobs/<int:pk>/", IllustrationJobDetailView.as_view()),
     #path("extention/generate/", GenerateExtentionView.as_view()),
     path("extention/generate/", CreateChatRoomView.as_view()),
     path("chatroom/<int:pk>/", ChatRoomView.as_view())
@@ -1,123 +1,54 @@
 from django.shortcuts import render
-import os, json, base64, re, random
-from uuid import uuid4
-from django.conf import settings
-from django.utils import timezone
 from rest_framework import views, status
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
+from django.db import transaction
 
 from rest_framework.response import Response
-from dotenv import load_dotenv
-from openai import OpenAI
 
-from story.models import Story, StoryPage, Illustrations
+from story.models import Story
 from .models import IllustrationJob, ChatRoom
 from .serializers import *
-
-load_dotenv(settings.BASE_DIR/ ".env")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-SAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
-
-def safe_filename(s: str) -> str:
-    return SAFE_FILENAME_RE.sub("_", s.strip())[:80] or "story"
+from .services.illustration_service import enqueue_illustration_job
 
 class GenerateIllustrationsView(views.APIView):
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         story_id = request.data.get("story_id")
-        story = Story.objects.filter(id=story_id).first()
-        if not story:
-            return Response({"detail": "Story not found"}, status=404)
-
-        pages = story.pages.all().order_by("page_number")
-        total_pages = len(pages)
-        if total_pages == 0:
-            return Response({"detail": "No pages in story"}, status=400)
 
-        job = IllustrationJob.objects.create(story=story, total_pages=2, status="RUNNING", started_at=timezone.now())
+        with transaction.atomic():
+            # 본인 동화만 삽화 생성 가능, 같은 동화의 동시 요청은 동화 row 잠금으로 직렬화
+            story = Story.objects.select_for_update().filter(id=story_id, user=request.user).first()
+            if not story:
+                return Response({"detail": "Story not found"}, status=404)
+
+            # 이미 진행 중인 작업이 있으면 새로 만들지 않고 그 작업을 반환 (중복 생성 비용 방지)
+            job = (
+                IllustrationJob.objects
+                .filter(story=story, status__in=["PENDING", "RUNNING"])
+                .order_by("-created_at")
+                .first()
+            )
+            if job:
+                return Response({"job": IllustrationJobSerializer(job).data}, status=202)
 
-        safe_title = safe_filename(story.title)
+            total_pages = story.pages.count()
+            if total_pages == 0:
+                return Response({"detail": "No pages in story"}, status=400)
 
-        try:
-            # 1. 전체 스토리 텍스트를 하나의 prompt로 구성하여 맥락 유지
-            story_context = "\n".join([f"Page {p.page_number}: {p.text}" for p in pages])
-            intro_page = pages.first()
-            final_page = pages.last()
+            # 삽화 생성은 백그라운드 워커가 처리하고 요청은 즉시 반환
+            job = IllustrationJob.objects.create(story=story, total_pages=total_pages, status="PENDING")
+            enqueue_illustration_job(job.id)
 
-            # 2. 1페이지 삽화 생성
-            intro_prompt = (
-                "You are illustrating a children's storybook. "
-                "Understand the full story context below to keep coherence:\n\n"
-                f"{story_context}\n\n"
-                f"Now create an illustration for the *first page*:\n{intro_page.text}"
-            )
-            intro_result = client.images.generate(
-                model="gpt-image-1",
-                prompt=intro_prompt,
-                size="1536x1024"
-            )
-            intro_b64 = intro_result.data[0].b64_json
-            intro_bytes = base64.b64decode(intro_b64)
-            intro_filename = f"{safe_title}_p{intro_page.page_number}_{uuid4().hex[:8]}.png"
-            
-            file_obj = ContentFile(intro_bytes)
-            s3_path = default_storage.save(intro_filename, file_obj)
-            s3_url = default_storage.url(s3_path)
-
-            Illustrations.objects.create(
-                story_page=intro_page,
-                image=s3_path,
-                prompt=intro_prompt,
-                style="default"
-            )
-            job.completed_pages = 1
-            job.save(update_fields=["completed_pages"])
-
-            # 3. 마지막 페이지 삽화 생성 (스토리의 마무리 느낌 강조)
-            outro_prompt = (
-                "Using the same overall story context to ensure narrative consistency, "
-                "create an illustration for the *final page* of the story. The style of illustration should be similar with the intro page.\n\n"
-                f"{story_context}\n\n"
-                f"Focus on emotional or narrative closure based on this last page:\n{final_page.text}"
-            )
-            outro_result = client.images.generate(
-                model="gpt-image-1",
-                prompt=outro_prompt,
-                size="1536x1024"
-            )
-            outro_b64 = outro_result.data[0].b64_json
-            outro_bytes = base64.b64decode(outro_b64)
-            outro_filename = f"{safe_title}_p{final_page.page_number}_{uuid4().hex[:8]}.png"
-            
-            file_obj = ContentFile(outro_bytes)
-            s3_path = default_storage.save(outro_filename, file_obj)
-            s3_url = default_storage.url(s3_path)
-
-            Illustrations.objects.create(
-                story_page=final_page,
-                image=s3_path,
-                prompt=outro_prompt,
-                style="default"
-            )
+        return Response({"job": IllustrationJobSerializer(job).data}, status=202)
 
-            job.completed_pages = 2
-            job.status = "SUCCESS"
-            job.finished_at = timezone.now()
-            job.save()
-
-            return Response({"job": IllustrationJobSerializer(job).data}, status=200)
+class IllustrationJobDetailView(views.APIView):
+    permission_classes = [IsAuthenticated]
 
-        except Exception as e:
-            job.status = "FAILED"
-            job.error_message = str(e)
-            job.finished_at = timezone.now()
-            job.save()
-            return Response({"error": str(e)}, status=500)
+    def get(self, request, pk):
+        job = get_object_or_404(IllustrationJob, pk=pk, story__user=request.user)
+        return Response({"job": IllustrationJobSerializer(job).data}, status=200)
 
 class CreateChatRoomView(views.APIView):
     permission_classes = [IsAuthenticated]
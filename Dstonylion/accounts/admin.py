@@ -12,4 +12,6 @@ class ChildAdmin(admin.ModelAdmin):
 
 admin.site.register(ClonedVoice)
 class VoiceAdmin(admin.ModelAdmin):
-    list_display = ("id", "voice_name", "user", "voice_file")
\ No newline at end of file
+    list_display = ("id", "voice_name", "user", "voice_file")
+
+admin.site.register(VoiceCloneJob)
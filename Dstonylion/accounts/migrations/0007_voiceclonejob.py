@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_alter_clonedvoice_voice_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VoiceCloneJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(default='PENDING', max_length=20)),
+                ('reference_audio', models.CharField(max_length=255)),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='voice_clone_jobs', to=settings.AUTH_USER_MODEL)),
+                ('voice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='clone_jobs', to='accounts.clonedvoice')),
+            ],
+        ),
+    ]
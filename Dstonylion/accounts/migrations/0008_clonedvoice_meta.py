@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_voiceclonejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clonedvoice',
+            name='cloned_voice_meta',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -37,9 +37,21 @@ class ClonedVoice(models.Model):
     voice_image_code = models.CharField(max_length=50)
     se_file = models.FileField(upload_to="cloned_se/", null=True, blank=True)  # 사용자의 음색 벡터 파일
     cloned_voice_file = models.FileField(upload_to="tts_outputs/", null=True, blank=True)  # 변환된 클로닝 음성
+    cloned_voice_meta = models.JSONField(default=dict, blank=True)  # 클로닝 음성 인코딩 정보 (codec, bitrate, duration 등)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"{self.user.username}의 클로닝된 음성"
-    
 
+class VoiceCloneJob(models.Model):
+    voice = models.ForeignKey(ClonedVoice, on_delete=models.CASCADE, related_name="clone_jobs")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="voice_clone_jobs")
+    status = models.CharField(max_length=20, default="PENDING")  # PENDING, RUNNING, SUCCESS, FAILED
+    reference_audio = models.CharField(max_length=255)  # 업로드된 참조 음성 S3 경로
+    error_message = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Voice clone for {self.voice_id} ({self.status})"
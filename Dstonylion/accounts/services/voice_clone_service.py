@@ -0,0 +1,70 @@
+import threading, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from accounts.models import VoiceCloneJob
+from accounts.services.voice_clone_worker import init_worker_process, run_voice_clone_job
+
+# 클로닝(VAD + SE 추출 + 음색 변환)은 CPU 작업이라 웹 프로세스 밖의 프로세스 풀에서 실행
+# 워커 진입점은 Django import 없는 voice_clone_worker 모듈에 둠 (spawn 자식에서 setup 전에 import되므로)
+_process_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_process_pool(reset=False):
+    global _process_pool
+    with _pool_lock:
+        if reset and _process_pool is not None:
+            _process_pool.shutdown(wait=False)
+            _process_pool = None
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=settings.VOICE_CLONE_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker_process,
+                initargs=(settings.DATABASES,),
+            )
+        return _process_pool
+
+
+def _on_job_done(job_id, future):
+    # 워커 프로세스가 비정상 종료된 경우 job이 RUNNING으로 남지 않도록 처리
+    error = future.exception()
+    if error is None:
+        return
+    close_old_connections()
+    try:
+        VoiceCloneJob.objects.filter(id=job_id).exclude(status="SUCCESS").update(
+            status="FAILED",
+            error_message=str(error) or error.__class__.__name__,
+            finished_at=timezone.now(),
+        )
+    finally:
+        close_old_connections()
+
+
+def _submit(job_id):
+    try:
+        future = _get_process_pool().submit(run_voice_clone_job, job_id)
+    except BrokenProcessPool:
+        future = _get_process_pool(reset=True).submit(run_voice_clone_job, job_id)
+    future.add_done_callback(lambda f: _on_job_done(job_id, f))
+    return future
+
+
+def shutdown_process_pool(wait=True):
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=wait)
+            _process_pool = None
+
+
+def enqueue_voice_clone_job(job_id):
+    """
+    클로닝 작업을 프로세스 풀에 등록 (트랜잭션 커밋 이후 실행)
+    """
+    transaction.on_commit(lambda: _submit(job_id))
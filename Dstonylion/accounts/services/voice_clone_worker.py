@@ -0,0 +1,101 @@
+#클로닝 프로세스 풀(spawn) 워커 진입점
+# 자식 프로세스는 initializer를 unpickle하면서 이 모듈을 먼저 import하고 그 뒤에 django.setup()이 실행되므로,
+# 모듈 최상단에는 Django 설정/모델 import를 두지 않고 함수 안에서 import
+import os, tempfile, traceback
+
+
+def init_worker_process(databases=None):
+    """
+    워커 프로세스 초기화: 모델 로드 허용 + Django 설정
+    databases: 부모 프로세스의 DATABASES (테스트 DB 등 부모와 같은 DB를 보도록)
+    """
+    # 클로닝 워커는 웹 프로세스 설정과 관계없이 모델 로드 허용
+    os.environ["INFERENCE_MODELS_ENABLED"] = "1"
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "stonylion.settings")
+
+    from django.conf import settings
+    if databases:
+        settings.DATABASES = databases
+
+    import django
+    django.setup()
+
+
+def base_speaker_paths():
+    from django.conf import settings
+
+    base_dir = os.path.join(settings.BASE_DIR.parent, "checkpoints_v2/base_speakers")
+    return os.path.join(base_dir, "base_ko.wav"), os.path.join(base_dir, "ses/kr.pth")
+
+
+def run_voice_clone_job(job_id):
+    """
+    프로세스 풀 워커에서 실행: 참조 음성 다운로드 → 클로닝 → 결과 S3 업로드
+    """
+    from django.core.files import File
+    from django.core.files.storage import default_storage
+    from django.db import close_old_connections
+    from django.utils import timezone
+    from accounts.models import VoiceCloneJob
+
+    close_old_connections()
+    try:
+        # 무거운 모델 모듈 import 실패도 job 실패로 기록
+        import torch
+        from story.services.openvoice_service import clone_voice
+        from story.services.audio_codec import store_encoded_audio
+        from story.services.narration_service import invalidate_voice_narrations
+
+        job = VoiceCloneJob.objects.select_related("voice").get(id=job_id)
+        job.status = "RUNNING"
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "started_at"])
+
+        base_speaker_audio, base_speaker_se = base_speaker_paths()
+        voice = job.voice
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # reference_audio 임시 파일로 저장 (OpenVoice 입력용)
+            ref_path = os.path.join(tmp_dir, "reference.wav")
+            with default_storage.open(job.reference_audio, "rb") as src, open(ref_path, "wb") as dst:
+                for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                    dst.write(chunk)
+
+            output_path = os.path.join(tmp_dir, f"{job.user_id}_clone.wav")
+            se_path = os.path.join(tmp_dir, f"{job.user_id}_se.pth")
+
+            output_path, target_se = clone_voice(
+                source_audio_path=base_speaker_audio,
+                reference_audio_path=ref_path,
+                base_speaker_se_path=base_speaker_se,
+                output_path=output_path
+            )
+            # SE 벡터 파일로 저장
+            torch.save(target_se, se_path)
+
+            # S3 업로드 (클로닝 음성은 Opus/AAC로 인코딩해 저장)
+            s3_voice_path, voice_meta = store_encoded_audio(output_path, f"tts_outputs/{job.user_id}_clone")
+            with open(se_path, "rb") as f:
+                s3_se_path = default_storage.save(
+                    f"tts_outputs/{job.user_id}_se.pth", File(f)
+                )
+
+        voice.cloned_voice_file = s3_voice_path
+        voice.cloned_voice_meta = voice_meta
+        voice.se_file = s3_se_path
+        voice.save(update_fields=["cloned_voice_file", "cloned_voice_meta", "se_file"])
+        # 이전 SE로 합성한 낭독 음성이 계속 재사용되지 않도록 캐시 삭제
+        invalidate_voice_narrations(voice.id)
+
+        job.status = "SUCCESS"
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "finished_at"])
+
+    except Exception as e:
+        traceback.print_exc()
+        VoiceCloneJob.objects.filter(id=job_id).update(
+            status="FAILED",
+            error_message=str(e),
+            finished_at=timezone.now(),
+        )
+    finally:
+        close_old_connections()
@@ -1,3 +1,65 @@
-from django.test import TestCase
+import os, uuid, importlib.util, unittest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TransactionTestCase
 
-# Create your tests here.
+from accounts.models import ClonedVoice, VoiceCloneJob
+from accounts.services import voice_clone_service
+from accounts.services.voice_clone_worker import base_speaker_paths
+
+# 실제 클로닝은 OpenVoice/MeloTTS 모델, checkpoints_v2, S3 버킷이 모두 있어야 가능
+CLONE_AVAILABLE = (
+    all(importlib.util.find_spec(m) for m in ("torch", "openvoice", "melo"))
+    and os.path.exists(os.path.join(settings.BASE_DIR.parent, "checkpoints_v2"))
+    and bool(settings.AWS_STORAGE_BUCKET_NAME)
+)
+
+
+class VoiceCloneProcessPoolTests(TransactionTestCase):
+    """
+    spawn 프로세스 풀을 실제로 띄워 워커가 Django 설정/모델을 로드하고 job을 처리하는지 확인
+    (자식 프로세스도 같은 테스트 DB를 봐야 하므로 TransactionTestCase)
+    """
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="cloner", password="pw")
+        self.voice = ClonedVoice.objects.create(user=self.user, voice_name="엄마", voice_image_code="1")
+
+    def tearDown(self):
+        voice_clone_service.shutdown_process_pool()
+
+    def submit(self, reference_audio):
+        job = VoiceCloneJob.objects.create(voice=self.voice, user=self.user, reference_audio=reference_audio)
+        future = voice_clone_service._submit(job.id)
+        # 워커 초기화가 실패하면 여기서 BrokenProcessPool
+        self.assertIsNone(future.exception(timeout=600))
+        job.refresh_from_db()
+        return job
+
+    def test_worker_process_records_job_result(self):
+        job = self.submit(f"tests/missing_{uuid.uuid4().hex}.wav")
+
+        # 참조 음성이 없으므로 워커가 직접 job을 FAILED로 기록 (풀이 깨졌다면 BrokenProcessPool 메시지)
+        self.assertEqual(job.status, "FAILED")
+        self.assertTrue(job.error_message)
+        self.assertNotIn("BrokenProcessPool", job.error_message)
+        self.assertNotIn("AppRegistryNotReady", job.error_message)
+        self.assertIsNotNone(job.finished_at)
+
+    @unittest.skipUnless(CLONE_AVAILABLE, "OpenVoice 모델/체크포인트/S3 버킷이 필요함")
+    def test_clone_job_reaches_success(self):
+        # 기본 화자 음성을 참조 음성으로 사용
+        base_speaker_audio, _ = base_speaker_paths()
+        with open(base_speaker_audio, "rb") as f:
+            reference = default_storage.save(f"tests/reference_{uuid.uuid4().hex}.wav", ContentFile(f.read()))
+
+        try:
+            job = self.submit(reference)
+            self.assertEqual(job.status, "SUCCESS", job.error_message)
+            self.voice.refresh_from_db()
+            self.assertTrue(self.voice.se_file)
+            self.assertTrue(self.voice.cloned_voice_file)
+        finally:
+            default_storage.delete(reference)
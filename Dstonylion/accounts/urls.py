@@ -17,5 +17,6 @@ urlpatterns = [
     path("voice/", VoiceCreateView.as_view(), name="voice-create"),
     path("voice/<int:voice_id>/", VoiceDetailView.as_view(), name="voice-detail"),
     path("voice/clone/", VoiceCloneView.as_view(), name="user-voice-clone"),
+    path("voice/clone/jobs/<int:job_id>/", VoiceCloneJobDetailView.as_view(), name="user-voice-clone-job"),
     path("children/", ChildrenListView.as_view(), name="children-list"),
 ]
\ No newline at end of file
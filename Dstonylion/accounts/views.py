@@ -1,7 +1,4 @@
-import os
 import boto3
-import torch
-from django.conf import settings
 from django.shortcuts import render
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -9,16 +6,15 @@ from rest_framework import status, views
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken, OutstandingToken, BlacklistedToken
 from django.db import transaction
-import tempfile
 from django.core.files import File
 from django.utils import timezone
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
-# from story.services.openvoice_service import clone_voice
 
 from mylibrary.models import Library
 from story.models import Story, Illustrations
-from accounts.models import Child, ClonedVoice
+from accounts.models import Child, ClonedVoice, VoiceCloneJob
+from accounts.services.voice_clone_service import enqueue_voice_clone_job
 from .serializers import *
 # Create your views here.
 
@@ -454,22 +450,13 @@ class VoiceCreateView(APIView):
 
 
 class VoiceCloneView(APIView):
+    """
+    참조 음성을 업로드하고 클로닝 작업을 등록하는 API (작업은 프로세스 풀에서 실행)
+    POST /api/accounts/voice/clone/
+    """
     permission_classes = [IsAuthenticated]
 
-    BASE_SPEAKER_AUDIO = os.path.join(
-    settings.BASE_DIR.parent, 
-    "checkpoints_v2/base_speakers/base_ko.wav"
-)
-
-    BASE_SPEAKER_SE = os.path.join(
-        settings.BASE_DIR.parent, 
-        "checkpoints_v2/base_speakers/ses/kr.pth"
-    )
-
     def post(self, request):
-        tmp_ref_path = None
-        output_path = None
-        se_path = None
         try:
             voice_id = request.data.get("voice_id")
             if not voice_id:
@@ -493,61 +480,53 @@ class VoiceCloneView(APIView):
             voice.reference_audio_url = reference_audio_url
             voice.save()
 
-            # reference_audio 임시 파일로 저장 (OpenVoice 입력용)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_ref:
-                for chunk in reference_audio.chunks():
-                    tmp_ref.write(chunk)
-                tmp_ref_path = tmp_ref.name
-
-            # 출력 경로 준비
-            output_dir = "outputs_v2"
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, f"{request.user.id}_clone.wav")
-            se_path = os.path.join(output_dir, f"{request.user.id}_se.pth")
-
-            # 클로닝 수행 (서비스 함수 호출)
-            output_path, target_se = clone_voice(
-                source_audio_path=self.BASE_SPEAKER_AUDIO,
-                reference_audio_path=tmp_ref_path,
-                base_speaker_se_path=self.BASE_SPEAKER_SE,
-                output_path=output_path
+            # 클로닝 작업 등록 후 즉시 반환
+            job = VoiceCloneJob.objects.create(
+                voice=voice,
+                user=request.user,
+                reference_audio=s3_ref_path,
             )
-            # SE 벡터 파일로 저장
-            torch.save(target_se, se_path)
-
-            # S3 업로드
-            with open(output_path, "rb") as f:
-                s3_voice_path = default_storage.save(
-                    f"tts_outputs/{request.user.id}_clone.wav", File(f)
-                )
-            with open(se_path, "rb") as f:
-                s3_se_path = default_storage.save(
-                    f"tts_outputs/{request.user.id}_se.pth", File(f)
-                )
-            cloned_url = default_storage.url(s3_voice_path)
-            se_url = default_storage.url(s3_se_path)
-
-            # 기존 Voice 객체 업데이트
-            voice.cloned_voice_file = s3_voice_path
-            voice.se_file = s3_se_path
-            voice.save()
+            enqueue_voice_clone_job(job.id)
 
             return Response({
+                "job_id": job.id,
                 "voice_id": voice.id,
-                "voice_name": voice.voice_name,
+                "status": job.status,
                 "reference_audio_url": reference_audio_url,
-                "cloned_voice_url": cloned_url,
-                "se_file_url": se_url
-            }, status=200)
+            }, status=202)
 
         except Exception as e:
             return Response({"error": str(e)}, status=500)
 
-        finally:
-            # 🧹 임시 파일 정리 (에러 여부와 관계없이 실행)
-            for path in [tmp_ref_path, output_path, se_path]:
-                if path and os.path.exists(path):
-                    os.remove(path)
+
+class VoiceCloneJobDetailView(APIView):
+    """
+    클로닝 작업 상태 조회 API
+    GET /api/accounts/voice/clone/jobs/<job_id>/
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        try:
+            job = VoiceCloneJob.objects.select_related("voice").get(id=job_id, user=request.user)
+        except VoiceCloneJob.DoesNotExist:
+            return Response({"error": "해당 작업을 찾을 수 없습니다."}, status=404)
+
+        voice = job.voice
+        data = {
+            "job_id": job.id,
+            "voice_id": voice.id,
+            "status": job.status,
+            "error_message": job.error_message,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+        }
+        if job.status == "SUCCESS":
+            data["cloned_voice_url"] = voice.cloned_voice_file.url if voice.cloned_voice_file else None
+            data["cloned_voice_meta"] = voice.cloned_voice_meta
+            data["se_file_url"] = voice.se_file.url if voice.se_file else None
+
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class VoiceDetailView(APIView):
@@ -652,6 +631,13 @@ class VoiceDetailView(APIView):
                 except Exception as e:
                     print("S3 cloned_voice_file 삭제 실패:", e)
 
+            # 원본 wav를 보관한 경우 함께 삭제
+            if voice.cloned_voice_meta.get("source"):
+                try:
+                    s3.delete_object(Bucket=bucket_name, Key=voice.cloned_voice_meta["source"])
+                except Exception as e:
+                    print("S3 원본 wav 삭제 실패:", e)
+
             # ----------------------------------------------------
             # 3) S3에서 se_file 삭제
             # ----------------------------------------------------
@@ -689,7 +675,12 @@ class VoiceListView(APIView):
     def get(self, request):
         try:
             user = request.user
-            voices = ClonedVoice.objects.filter(user=user)
+            voices = list(ClonedVoice.objects.filter(user=user))
+
+            # 목록 전체 URL을 한 번에 서명
+            signed_urls = default_storage.bulk_url(
+                [v.cloned_voice_file.name for v in voices if v.cloned_voice_file]
+            )
 
             result = []
 
@@ -698,7 +689,7 @@ class VoiceListView(APIView):
                     "voice_id": v.id,
                     "name": v.voice_name,
                     "cloned_voice_url": (
-                        request.build_absolute_uri(v.cloned_voice_file.url)
+                        request.build_absolute_uri(signed_urls[v.cloned_voice_file.name])
                         if v.cloned_voice_file else None
                     ),
                     "voice_image_code": v.voice_image_code, 
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mylibrary', '0002_remove_library_likes_delete_history'),
+        ('story', '0006_story_list_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='library',
+            index=models.Index(fields=['user', '-last_viewed_time', '-id'], name='library_user_viewed_id_idx'),
+        ),
+    ]
@@ -11,3 +11,7 @@ class Library(models.Model):
 
     class Meta:
         unique_together = ('user', 'story')
+        # 최근 읽은 동화 cursor 페이지네이션용 (user, last_viewed_time, id) 인덱스
+        indexes = [
+            models.Index(fields=["user", "-last_viewed_time", "-id"], name="library_user_viewed_id_idx"),
+        ]
@@ -1,3 +1,101 @@
+import unittest
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
-# Create your tests here.
+from mylibrary.models import Library
+from story.models import Story
+from story.pagination import KeysetPagination, InvalidCursor, encode_cursor
+
+
+class LibraryKeysetPaginationTests(TestCase):
+    """
+    서재 cursor 페이지네이션: NULL 포함 정렬 결과와 인덱스 사용 여부
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="reader", password="pw")
+        other = get_user_model().objects.create_user(username="other", password="pw")
+        base = timezone.now()
+
+        for i in range(30):
+            story = Story.objects.create(user=cls.user, title=f"동화 {i}", author="작가", content="본문")
+            # 같은 시각이 여러 개 + 아직 읽지 않은(NULL) 동화 섞기
+            viewed = None if i % 4 == 0 else base - timedelta(minutes=i // 3)
+            Library.objects.create(user=cls.user, story=story, last_viewed_time=viewed)
+            Library.objects.create(user=other, story=story, last_viewed_time=base)
+
+    def request(self, **params):
+        return Request(APIRequestFactory().get("/", params))
+
+    def walk(self, paginator, page_size):
+        queryset = Library.objects.filter(user=self.user)
+        items, cursor = paginator.paginate(queryset, self.request(page_size=page_size))
+        while cursor:
+            page, cursor = paginator.paginate(queryset, self.request(page_size=page_size, cursor=cursor))
+            items += page
+        return items
+
+    def test_recent_read_order_puts_unread_last(self):
+        libraries = list(Library.objects.filter(user=self.user))
+        viewed = sorted((l for l in libraries if l.last_viewed_time), key=lambda l: (l.last_viewed_time, l.id), reverse=True)
+        unread = sorted((l for l in libraries if not l.last_viewed_time), key=lambda l: l.id, reverse=True)
+
+        for page_size in (1, 4, 7, 100):
+            with self.subTest(page_size=page_size):
+                items = self.walk(KeysetPagination("last_viewed_time"), page_size)
+                self.assertEqual([l.id for l in items], [l.id for l in viewed + unread])
+
+    def test_recent_generated_order(self):
+        expected = list(Library.objects.filter(user=self.user).order_by("-story_id").values_list("id", flat=True))
+        items = self.walk(KeysetPagination("story_id", "story_id"), 7)
+        self.assertEqual([l.id for l in items], expected)
+
+    def test_page_query_count(self):
+        paginator = KeysetPagination("last_viewed_time")
+        queryset = Library.objects.filter(user=self.user)
+
+        # 값이 있는 구간 안에서는 쿼리 1번, NULL 구간으로 넘어가는 페이지만 2번
+        with self.assertNumQueries(1):
+            _, cursor = paginator.paginate(queryset, self.request(page_size=5))
+        with self.assertNumQueries(1):
+            paginator.paginate(queryset, self.request(page_size=5, cursor=cursor))
+        with self.assertNumQueries(2):
+            paginator.paginate(queryset, self.request(page_size=100))
+
+    @unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN 형식은 SQLite 기준")
+    def test_page_queries_use_index_without_sort(self):
+        # 정렬 컬럼까지 인덱스 범위 조건으로 쓰여야 함 (user_id만 쓰고 나머지를 필터링하면 실패)
+        cases = [
+            (KeysetPagination("last_viewed_time"), "library_user_viewed_id_idx", "last_viewed_time"),
+            # unique_together ('user', 'story') 인덱스
+            (KeysetPagination("story_id", "story_id"), "user_id_story_id", "story_id"),
+        ]
+        for paginator, index, column in cases:
+            queryset = Library.objects.filter(user=self.user)
+            _, cursor = paginator.paginate(queryset, self.request(page_size=10))
+            with CaptureQueriesContext(connection) as ctx:
+                paginator.paginate(queryset, self.request(page_size=100, cursor=cursor))
+
+            for query in ctx.captured_queries:
+                with connection.cursor() as c, self.subTest(field=paginator.field, sql=query["sql"]):
+                    c.execute("EXPLAIN QUERY PLAN " + query["sql"])
+                    plan = " / ".join(row[-1] for row in c.fetchall())
+                    self.assertIn(index, plan)
+                    self.assertIn(f"user_id=? AND {column}", plan)
+                    self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_cursor_value_must_match_field(self):
+        paginator = KeysetPagination("last_viewed_time")
+        queryset = Library.objects.filter(user=self.user)
+        for values in (["어제", 1], [123, 1], [None, "x"], [[1], 1]):
+            with self.subTest(values=values), self.assertRaises(InvalidCursor):
+                paginator.paginate(queryset, self.request(cursor=encode_cursor(values)))
+        with self.assertRaises(InvalidCursor):
+            KeysetPagination("story_id", "story_id").paginate(queryset, self.request(cursor=encode_cursor([None, 1])))
@@ -8,6 +8,7 @@ from .models import Library, User
 from .serializers import *
 from story.models import *
 from story.serializers import *
+from story.pagination import KeysetPagination, InvalidCursor
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -23,13 +24,17 @@ class RecentReadView(views.APIView):
         if category in ["classic", "custom", "extended"]:
             libraries = libraries.filter(story__category=category)
 
-        libraries = libraries.order_by("-last_viewed_time")
-        
+        # 최근 읽은 순 cursor 페이지네이션 (아직 읽지 않은 동화는 맨 뒤)
+        try:
+            libraries, next_cursor = KeysetPagination("last_viewed_time").paginate(libraries, request)
+        except InvalidCursor as e:
+            return Response({"error": str(e)}, status=400)
+
         serializer = LibrarySerializer(libraries, many=True)
 
         return Response({
-            "count": libraries.count(),
-            "results": serializer.data
+            "results": serializer.data,
+            "next_cursor": next_cursor
         })
     
 class RecentGeneratedView(views.APIView):
@@ -43,13 +48,19 @@ class RecentGeneratedView(views.APIView):
         if category in ["classic", "custom", "extended"]:
             libraries = libraries.filter(story__category=category)
 
-        libraries = libraries.order_by("-story__created_at")
+        # 동화 생성 순 cursor 페이지네이션
+        # Story.created_at은 생성 시각이라 story_id 순서와 같으므로 조인 없이 story_id로 정렬
+        # (사용자당 동화는 하나라 story_id가 곧 고유 키, unique (user, story) 인덱스로 범위 스캔)
+        try:
+            libraries, next_cursor = KeysetPagination("story_id", "story_id").paginate(libraries, request)
+        except InvalidCursor as e:
+            return Response({"error": str(e)}, status=400)
 
         serializer = LibrarySerializer(libraries, many=True)
 
         return Response({
-            "count": libraries.count(),
-            "results":serializer.data
+            "results": serializer.data,
+            "next_cursor": next_cursor
         })
 
 class LibraryDetailView(views.APIView):
@@ -125,6 +125,76 @@ CHANNEL_LAYERS = {
     }
 }
 
+# 동화 생성 세션/받아쓰기 draft용 Redis (프로세스당 하나의 커넥션 풀 공유)
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 100))
+# async 풀의 커넥션이 모두 사용 중일 때 빈 커넥션을 기다리는 최대 시간(초)
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 5))
+# 동화 생성 세션(story_session:{user_id}) 만료 시간(초), 접근할 때마다 갱신
+STORY_SESSION_TTL = int(os.getenv("STORY_SESSION_TTL", 60 * 60 * 24))
+
+# 삽화 생성 백그라운드 워커
+ILLUSTRATION_JOB_WORKERS = int(os.getenv("ILLUSTRATION_JOB_WORKERS", 2))
+ILLUSTRATION_PAGE_CONCURRENCY = int(os.getenv("ILLUSTRATION_PAGE_CONCURRENCY", 4))
+# 생성 이미지 업로드 시 이 크기를 넘으면 메모리 대신 임시 파일로 spool
+IMAGE_INGEST_SPOOL_MAX_SIZE = int(os.getenv("IMAGE_INGEST_SPOOL_MAX_SIZE", 512 * 1024))
+IMAGE_VARIANT_WEBP_QUALITY = int(os.getenv("IMAGE_VARIANT_WEBP_QUALITY", 80))
+# 프로세스 전체에서 동시에 WebP 파생 이미지를 만드는 개수 (원본 비트맵 디코딩 메모리 상한)
+IMAGE_VARIANT_CONCURRENCY = int(os.getenv("IMAGE_VARIANT_CONCURRENCY", 2))
+
+# 이 프로세스에서 OpenVoice/MeloTTS 모델 로드 허용 여부 (API 전용 워커는 0)
+INFERENCE_MODELS_ENABLED = os.getenv("INFERENCE_MODELS_ENABLED", "1") == "1"
+
+# 로컬 추론 서버 (python manage.py runinferenceserver). 소켓이 설정되면 웹 워커는 추론을 서버에 위임
+INFERENCE_SERVER_SOCKET = os.getenv("INFERENCE_SERVER_SOCKET", "")
+INFERENCE_SERVER_TIMEOUT = int(os.getenv("INFERENCE_SERVER_TIMEOUT", 300))
+INFERENCE_MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", 8))
+INFERENCE_MAX_BATCH_WAIT_MS = int(os.getenv("INFERENCE_MAX_BATCH_WAIT_MS", 20))
+# 추론 서버가 읽고 쓸 수 있는 음성 임시 파일 디렉터리 (웹 워커도 이 아래에 임시 폴더 생성)
+INFERENCE_SCRATCH_DIR = os.getenv("INFERENCE_SCRATCH_DIR", "/tmp/stonylion-inference")
+
+# TTS 모델 레지스트리: 프로세스당 유지할 언어 모델 수 / 이보다 여유 메모리가 적으면 LRU 해제
+TTS_MODEL_CACHE_SIZE = int(os.getenv("TTS_MODEL_CACHE_SIZE", 2))
+TTS_MODEL_MIN_FREE_MB = int(os.getenv("TTS_MODEL_MIN_FREE_MB", 0))
+# 배치 합성 시 한 번의 forward에 넣을 최대 문장 조각 수
+TTS_MAX_BATCH_SIZE = int(os.getenv("TTS_MAX_BATCH_SIZE", 8))
+# 메모리에 유지할 화자 임베딩(SE) 개수
+SPEAKER_SE_CACHE_SIZE = int(os.getenv("SPEAKER_SE_CACHE_SIZE", 256))
+
+# 동화 낭독 백그라운드 워커 (페이지 동시 합성 수 = CPU 예산)
+NARRATION_JOB_WORKERS = int(os.getenv("NARRATION_JOB_WORKERS", 1))
+NARRATION_CPU_BUDGET = int(os.getenv("NARRATION_CPU_BUDGET", max(1, (os.cpu_count() or 2) // 2)))
+
+# 생성 음성(낭독/클로닝) 저장 코덱: opus(ogg) 또는 aac(m4a). 원본 wav는 AUDIO_KEEP_WAV=1일 때만 보관
+AUDIO_CODEC = os.getenv("AUDIO_CODEC", "opus")
+AUDIO_OPUS_BITRATE = int(os.getenv("AUDIO_OPUS_BITRATE", 32000))
+AUDIO_AAC_BITRATE = int(os.getenv("AUDIO_AAC_BITRATE", 64000))
+AUDIO_KEEP_WAV = os.getenv("AUDIO_KEEP_WAV", "0") == "1"
+
+# 음성 인식(STT) 백엔드: local(faster-whisper, int8) 또는 openai(whisper-1 API)
+STT_BACKEND = os.getenv("STT_BACKEND", "local")
+# 로컬 인식 실패 시 whisper-1 API로 재시도
+STT_API_FALLBACK = os.getenv("STT_API_FALLBACK", "1") == "1"
+STT_MODEL = os.getenv("STT_MODEL", "small")
+STT_DEVICE = os.getenv("STT_DEVICE", "cpu")
+STT_COMPUTE_TYPE = os.getenv("STT_COMPUTE_TYPE", "int8")
+STT_CPU_THREADS = int(os.getenv("STT_CPU_THREADS", 0))
+# 프로세스 전체의 동시 인식 개수 (모든 WebSocket 연결이 공유)
+STT_NUM_WORKERS = int(os.getenv("STT_NUM_WORKERS", 2))
+# 실시간 partial 전용 동시 인식 개수 (final과 별도, 사용 중이면 partial은 버림)
+STT_PARTIAL_WORKERS = int(os.getenv("STT_PARTIAL_WORKERS", 1))
+STT_BEAM_SIZE = int(os.getenv("STT_BEAM_SIZE", 1))
+STT_LANGUAGE = os.getenv("STT_LANGUAGE", "ko")
+# 실시간 받아쓰기 VAD: 이 길이 이상 무음이면 발화 종료(final), 말하는 중에는 STT_PARTIAL_INTERVAL_S마다 partial
+STT_VAD_MIN_SILENCE_MS = int(os.getenv("STT_VAD_MIN_SILENCE_MS", 700))
+STT_VAD_SPEECH_PAD_MS = int(os.getenv("STT_VAD_SPEECH_PAD_MS", 200))
+STT_PARTIAL_INTERVAL_S = float(os.getenv("STT_PARTIAL_INTERVAL_S", 1.0))
+STT_MAX_SEGMENT_S = float(os.getenv("STT_MAX_SEGMENT_S", 20))
+
+# 목소리 클로닝 프로세스 풀 크기
+VOICE_CLONE_PROCESS_WORKERS = int(os.getenv("VOICE_CLONE_PROCESS_WORKERS", 1))
+
 # Redis
 CACHES = {
     "default": {
@@ -157,6 +227,8 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 클로닝 프로세스 풀 등 다른 프로세스도 같은 테스트 DB를 보도록 메모리 대신 파일 사용
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
@@ -212,6 +284,10 @@ AWS_S3_ADDRESSING_STYLE = "virtual"
 AWS_DEFAULT_ACL = None
 AWS_S3_FILE_OVERWRITE = False
 AWS_QUERYSTRING_AUTH = True
+AWS_QUERYSTRING_EXPIRE = 3600
+# 서명 URL 캐시: 만료 SIGNED_URL_EXPIRY_MARGIN초 전에 캐시에서 빠짐
+SIGNED_URL_CACHE_SIZE = int(os.getenv("SIGNED_URL_CACHE_SIZE", 10000))
+SIGNED_URL_EXPIRY_MARGIN = 600
 AWS_S3_OBJECT_PARAMETERS = {
     "CacheControl": "max-age=31536000, s-maxage=31536000, immutable"
 }
@@ -1,3 +1,5 @@
+import threading
+from cachetools import TTLCache
 from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage
 
@@ -6,6 +8,50 @@ class MediaStorage(S3Boto3Storage):
     location = 'media'
     file_overwrite = False
 
+    # 서명 URL 캐시: 만료 시간보다 충분히 짧은 TTL로 보관해 만료 직전 URL을 내려주지 않도록 함
+    _signed_url_cache = TTLCache(
+        maxsize=settings.SIGNED_URL_CACHE_SIZE,
+        ttl=settings.AWS_QUERYSTRING_EXPIRE - settings.SIGNED_URL_EXPIRY_MARGIN,
+    )
+    _signed_url_lock = threading.Lock()
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        # 기본 GET URL만 캐시 (커스텀 파라미터/만료시간은 매번 서명)
+        if parameters or expire is not None or http_method or not self.querystring_auth:
+            return super().url(name, parameters=parameters, expire=expire, http_method=http_method)
+
+        with self._signed_url_lock:
+            cached = self._signed_url_cache.get(name)
+        if cached is not None:
+            return cached
+
+        signed = super().url(name)
+        with self._signed_url_lock:
+            self._signed_url_cache[name] = signed
+        return signed
+
+    def bulk_url(self, names):
+        """
+        여러 파일의 서명 URL을 한 번에 반환 {name: url}
+        캐시에 있는 것은 락 한 번으로 꺼내고, 없는 것만 서명
+        """
+        names = [n for n in dict.fromkeys(names) if n]
+        if not self.querystring_auth:
+            return {name: self.url(name) for name in names}
+
+        with self._signed_url_lock:
+            urls = {name: self._signed_url_cache.get(name) for name in names}
+
+        missing = [name for name, url in urls.items() if url is None]
+        for name in missing:
+            urls[name] = super().url(name)
+
+        if missing:
+            with self._signed_url_lock:
+                for name in missing:
+                    self._signed_url_cache[name] = urls[name]
+        return urls
+
 class StaticStorage(S3Boto3Storage):
     bucket_name = settings.AWS_STORAGE_BUCKET_NAME
     location = 'static'
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Story, StoryPage, Illustrations, MoralTheme, StoryExtension, StoryLike, StoryView
+from .models import Story, StoryPage, Illustrations, MoralTheme, StoryExtension, StoryLike, StoryView, NarrationJob, NarrationAudio
 
 class StoryPageInline(admin.TabularInline):
     model = StoryPage
@@ -18,3 +18,5 @@ admin.site.register(MoralTheme)
 admin.site.register(StoryLike)
 admin.site.register(StoryView)
 admin.site.register(StoryExtension)
+admin.site.register(NarrationJob)
+admin.site.register(NarrationAudio)
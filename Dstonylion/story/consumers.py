@@ -1,20 +1,17 @@
-import json, os, re, asyncio, tempfile
-import redis
-import aiofiles
-from django.conf import settings
+import json, re, asyncio
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from channels.db import database_sync_to_async
 from rest_framework_simplejwt.tokens import AccessToken
 from django.contrib.auth import get_user_model
-from openai import AsyncOpenAI
-from dotenv import load_dotenv
 
-User = get_user_model()
+from .models import Story
+from .redis_client import DraftStore
+from .utils import split_into_sentences
+from .services.narration_service import page_text_hash, find_cached_audio, synthesize_sentence
+from .services.stt_service import transcribe_async, transcribe_partial_async, partials_enabled
+from .services.speech_buffer import SpeechBuffer, decode_chunk
 
-# Load env
-load_dotenv(settings.BASE_DIR / ".env")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+User = get_user_model()
 
 
 class DraftConsumer(AsyncJsonWebsocketConsumer):
@@ -51,19 +48,15 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
 
             self.user = self.scope["user"]
 
-            # Redis 연결
-            self.redis = redis.StrictRedis(
-                host=getattr(settings, "REDIS_HOST", "localhost"),
-                port=getattr(settings, "REDIS_PORT", 6379),
-                db=0,
-                decode_responses=True,
-            )
-
-            self.redis_draft_key = f"draft:{self.user.id}"
+            # draft 저장소 (프로세스 공용 async Redis 풀 사용)
+            self.draft_store = DraftStore(self.user.id)
 
             # 상태
             self.paused = False
-            self.audio_chunks = []
+            # 연결별 누적 음성 버퍼 (VAD로 발화 구간 단위 인식)
+            self.speech_buffer = SpeechBuffer()
+            self.utterance = 0
+            self.partial_task = None
 
             await self.accept()
             await self.send_json({"message": "🟢 STT 연결 성공"})
@@ -96,6 +89,7 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
 
                 if cmd == "pause":
                     self.paused = True
+                    await self._flush_audio()
                     await self.send_json({"status": "🟡 일시정지"})
                     return
 
@@ -105,11 +99,12 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
                     return
 
                 elif cmd == "stop":
+                    await self._flush_audio()
                     await self.send_json({"status": "🛑 녹음완료"})
                     return
 
                 elif cmd == "switch_to_text":
-                    current = self.redis.get(self.redis_draft_key) or ""
+                    current = await self.draft_store.get()
                     await self.send_json({
                         "status": "text_mode",
                         "draft_text": current
@@ -118,8 +113,8 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
 
                 elif cmd == "switch_to_voice":
                     text = data.get("draft_text", "")
-                    self._update_draft(text)
-                    last = self._get_last_sentences(1)
+                    await self._update_draft(text)
+                    last = await self.draft_store.last_sentences(1)
                     await self.send_json({
                         "status": "voice_mode",
                         "recent_text": last
@@ -128,34 +123,15 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
 
                 elif cmd == "save_text":
                     text = data.get("draft_text", "")
-                    self._update_draft(text)
+                    await self._update_draft(text)
                     await self.send_json({"status": "text_saved"})
                     return
 
-            # 오디오 chunk 처리
+            # 오디오 chunk 처리: 메모리에서 PCM으로 디코딩 → VAD 버퍼에 누적 → 발화 구간만 인식
             if bytes_data and not self.paused:
-                temp_path = await self._save_temp_audio(bytes_data)
-
-                try:
-                    loop = asyncio.get_event_loop()
-                    text = await loop.run_in_executor(None, self.transcribe_audio, temp_path)
-                    clean = self._normalize_text(text)
-
-                    if clean:
-                        self._append_to_draft(clean)
-                        await self.send_json({
-                            "type": "transcription",
-                            "text": clean
-                        })
-
-                except Exception as e:
-                    await self.send_json({"error": f"STT 오류: {str(e)}"})
-
-                finally:
-                    try:
-                        os.remove(temp_path)
-                    except:
-                        pass
+                loop = asyncio.get_running_loop()
+                segments = await loop.run_in_executor(None, self._feed_audio, bytes_data)
+                await self._handle_segments(segments)
 
         except Exception as e:
             await self.send_json({
@@ -163,33 +139,15 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
             })
 
 
-    # -------------------------------
-    # 🧠 Whisper STT
-    # -------------------------------
-    def transcribe_audio(self, filepath):
-        with open(filepath, "rb") as f:
-            result = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=f,
-                language="ko"
-            )
-        return result.text.strip()
-
-
     # -------------------------------
     # 📝 Draft 관리
     # -------------------------------
-    def _append_to_draft(self, new_text):
-        existing = self.redis.get(self.redis_draft_key) or ""
-        if existing and not existing.endswith((".", "?", "!")):
-            existing += ". "
+    async def _append_to_draft(self, new_text):
+        await self.draft_store.append(new_text)
 
-        updated = (existing + " " + new_text).strip()
-        self.redis.set(self.redis_draft_key, updated)
-
-    def _update_draft(self, text):
+    async def _update_draft(self, text):
         clean = self._normalize_text(text) if text else ""
-        self.redis.set(self.redis_draft_key, clean)
+        await self.draft_store.set(clean)
 
     def _normalize_text(self, text):
         text = re.sub(r"\s+", " ", text)
@@ -197,18 +155,187 @@ class DraftConsumer(AsyncJsonWebsocketConsumer):
             text += "."
         return text.strip()
 
-    def _get_last_sentences(self, n):
-        full = self.redis.get(self.redis_draft_key) or ""
-        sentences = re.split(r'(?<=[.!?])\s+', full)
-        return " ".join(sentences[-n:]).strip()
-
-
     # -------------------------------
-    # 🔊 TEMP AUDIO SAVE
+    # 🔊 AUDIO BUFFER / VAD
     # -------------------------------
-    async def _save_temp_audio(self, chunk_bytes):
-        fd, temp_path = tempfile.mkstemp(suffix=".wav")
-        os.close(fd)
-        async with aiofiles.open(temp_path, "wb") as f:
-            await f.write(chunk_bytes)
-        return temp_path
+    def _feed_audio(self, chunk_bytes):
+        return self.speech_buffer.feed(decode_chunk(chunk_bytes))
+
+    async def _flush_audio(self):
+        # 남은 버퍼의 VAD 처리도 이벤트 루프 밖에서
+        loop = asyncio.get_running_loop()
+        segments = await loop.run_in_executor(None, self.speech_buffer.flush)
+        await self._handle_segments(segments)
+
+    async def _handle_segments(self, segments):
+        for kind, segment in segments:
+            if kind == "final":
+                await self._send_final(segment)
+            elif partials_enabled() and (self.partial_task is None or self.partial_task.done()):
+                # 이전 partial이 아직 인식 중이면 건너뜀 (partial은 최신 결과만 의미 있음)
+                self.partial_task = asyncio.create_task(self._send_partial(segment, self.utterance))
+
+    async def _send_partial(self, segment, utterance):
+        try:
+            text = await transcribe_partial_async(segment)
+        except Exception as e:
+            print("partial STT 실패:", e)
+            return
+        # 그 사이 발화가 끝났으면 final이 이미 나갔으므로 버림
+        if text and utterance == self.utterance:
+            await self.send_json({"type": "partial", "text": text})
+
+    async def _send_final(self, segment):
+        self.utterance += 1
+        try:
+            text = await transcribe_async(segment)
+            clean = self._normalize_text(text) if text else ""
+
+            if clean:
+                await self._append_to_draft(clean)
+                await self.send_json({
+                    "type": "transcription",
+                    "text": clean
+                })
+
+        except Exception as e:
+            await self.send_json({"error": f"STT 오류: {str(e)}"})
+
+
+class NarrationStreamConsumer(AsyncJsonWebsocketConsumer):
+    """
+    페이지를 문장 단위로 합성/음색 변환해 준비되는 대로 바로 전송 (첫 음성까지 한 문장 분량의 추론만 대기)
+    ws/story/<story_id>/narration/stream/
+
+    요청: {"command": "play", "page_number": 1, "speed": 1.0} / {"command": "stop"}
+    응답: {"type": "audio_chunk", ...} 메타데이터 직후 해당 문장의 인코딩된 음성(AUDIO_CODEC)을 binary frame으로 전송
+    """
+
+    @database_sync_to_async
+    def get_user_from_token(self, user_id):
+        try:
+            return User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            return None
+
+    @database_sync_to_async
+    def get_story(self, story_id):
+        # 본인 동화만 낭독 스트리밍 가능
+        return Story.objects.select_related("voice").filter(id=story_id, user=self.scope["user"]).first()
+
+    @database_sync_to_async
+    def get_page_text(self, page_number):
+        page = self.story.pages.filter(page_number=page_number).first()
+        return page.text if page else None
+
+    @database_sync_to_async
+    def get_cached_audio_url(self, text, speed):
+        audio = find_cached_audio(page_text_hash(text), self.story.voice_id, speed)
+        return audio.audio.url if audio else None
+
+    async def connect(self):
+        try:
+            headers = dict(self.scope["headers"])
+            auth_header = headers.get(b"authorization")
+
+            if not auth_header:
+                raise ValueError("인증 헤더 없음")
+
+            # "Bearer <token>" / "<token>" 둘 다 허용
+            token = AccessToken(auth_header.decode().split()[-1])
+            self.scope["user"] = await self.get_user_from_token(token["user_id"])
+            if not self.scope["user"]:
+                raise ValueError("유효하지 않은 사용자")
+
+            self.story = await self.get_story(self.scope["url_route"]["kwargs"]["story_id"])
+            if not self.story:
+                raise ValueError("동화 없음")
+
+            self.stream_task = None
+            await self.accept()
+
+        except ValueError as e:
+            await self.send_json({"error_message": str(e)})
+            await self.close()
+
+        except Exception as e:
+            await self.send_json({"error_message": f"인증 오류: {str(e)}"})
+            await self.close()
+
+    async def disconnect(self, close_code):
+        await self.cancel_stream()
+
+    async def receive_json(self, content):
+        cmd = content.get("command")
+
+        if cmd == "stop":
+            await self.cancel_stream()
+            await self.send_json({"status": "stopped"})
+            return
+
+        if cmd != "play":
+            await self.send_json({"error": "알 수 없는 command"})
+            return
+
+        try:
+            page_number = int(content["page_number"])
+            speed = float(content.get("speed", 1.0))
+        except (KeyError, TypeError, ValueError):
+            await self.send_json({"error": "page_number, speed를 확인해주세요."})
+            return
+
+        # 새 페이지 요청이 오면 이전 스트림은 중단
+        await self.cancel_stream()
+        self.stream_task = asyncio.create_task(self.stream_page(page_number, speed))
+
+    async def cancel_stream(self):
+        task = getattr(self, "stream_task", None)
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.stream_task = None
+
+    async def stream_page(self, page_number, speed):
+        try:
+            text = await self.get_page_text(page_number)
+            if text is None:
+                await self.send_json({"error": "페이지 없음", "page_number": page_number})
+                return
+
+            # 전체 페이지 음성이 이미 있으면 합성 없이 URL만 전달
+            audio_url = await self.get_cached_audio_url(text, speed)
+            if audio_url:
+                await self.send_json({"type": "page_cached", "page_number": page_number, "audio_url": audio_url})
+                return
+
+            sentences = split_into_sentences(text)
+            loop = asyncio.get_running_loop()
+            voice = self.story.voice
+
+            # 현재 문장을 보내는 동안 다음 문장을 미리 합성
+            pending = loop.run_in_executor(None, synthesize_sentence, sentences[0], voice, speed) if sentences else None
+            for index, sentence in enumerate(sentences):
+                audio, audio_meta = await pending
+                if index + 1 < len(sentences):
+                    pending = loop.run_in_executor(None, synthesize_sentence, sentences[index + 1], voice, speed)
+
+                await self.send_json({
+                    "type": "audio_chunk",
+                    "page_number": page_number,
+                    "index": index,
+                    "total": len(sentences),
+                    "text": sentence,
+                    "format": audio_meta["codec"],
+                    "duration": audio_meta["duration"],
+                })
+                await self.send(bytes_data=audio)
+
+            await self.send_json({"type": "page_done", "page_number": page_number})
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self.send_json({"error": f"낭독 오류: {str(e)}", "page_number": page_number})
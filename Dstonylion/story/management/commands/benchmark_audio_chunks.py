@@ -0,0 +1,88 @@
+import asyncio, io, os, tempfile, time, wave
+import numpy as np
+import aiofiles
+from django.core.management.base import BaseCommand, CommandError
+
+from story.services.speech_buffer import SAMPLE_RATE, decode_chunk
+
+
+class Command(BaseCommand):
+    help = "DraftConsumer 음성 chunk 전달 비용 비교: 임시 파일(aiofiles) 경유 / 메모리(BytesIO)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--audio", help="측정에 쓸 음성 chunk 파일 (없으면 2초 16kHz WAV 생성)")
+        parser.add_argument("--seconds", type=float, default=2.0, help="생성할 WAV 길이")
+        parser.add_argument("--iterations", type=int, default=200, help="디코딩 포함 측정 반복 횟수")
+        parser.add_argument("--handoff-iterations", type=int, default=2000, help="전달만 측정할 때 반복 횟수")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options["audio"]:
+            try:
+                with open(options["audio"], "rb") as f:
+                    chunk = f.read()
+            except OSError as e:
+                raise CommandError(f"음성 파일을 읽을 수 없습니다: {options['audio']} ({e})")
+        else:
+            chunk = self.sample_wav(options["seconds"], options["seed"])
+
+        # 두 경로가 같은 PCM을 만드는지 먼저 확인
+        file_pcm = asyncio.run(self.via_temp_file(chunk, decode=True))
+        memory_pcm = decode_chunk(chunk)
+        if not np.array_equal(file_pcm, memory_pcm):
+            raise CommandError("임시 파일 경유 디코딩과 메모리 디코딩 결과가 다릅니다")
+        self.stdout.write(f"chunk {len(chunk)} bytes, {len(memory_pcm) / SAMPLE_RATE:.2f}s audio")
+
+        n = options["handoff_iterations"]
+        self.report("handoff  temp file (before)", n, asyncio.run(self.repeat_async(chunk, n, decode=False)))
+        self.report("handoff  BytesIO", n, self.repeat(lambda: io.BytesIO(chunk), n))
+
+        n = options["iterations"]
+        self.report("+decode  temp file (before)", n, asyncio.run(self.repeat_async(chunk, n, decode=True)))
+        self.report("+decode  BytesIO", n, self.repeat(lambda: decode_chunk(chunk), n))
+
+    async def via_temp_file(self, chunk_bytes, decode):
+        # 기존 DraftConsumer._save_temp_audio + 파일 경로로 STT 호출 + 삭제
+        fd, temp_path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                await f.write(chunk_bytes)
+            if decode:
+                from faster_whisper import decode_audio
+
+                return decode_audio(temp_path, sampling_rate=SAMPLE_RATE)
+        finally:
+            os.remove(temp_path)
+
+    async def repeat_async(self, chunk_bytes, iterations, decode):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await self.via_temp_file(chunk_bytes, decode)
+        return time.perf_counter() - started
+
+    def repeat(self, fn, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return time.perf_counter() - started
+
+    def report(self, label, iterations, elapsed):
+        self.stdout.write(
+            f"{label:28s} {iterations / elapsed:12,.0f} chunks/s ({elapsed / iterations * 1e6:9.1f} us/chunk)"
+        )
+
+    def sample_wav(self, seconds, seed):
+        # 무음이 아닌 음성 대역 신호 (톤 + 약한 잡음), 16bit mono
+        rng = np.random.default_rng(seed)
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        signal = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(len(t))
+        pcm = (np.clip(signal, -1, 1) * 32767).astype("<i2")
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(SAMPLE_RATE)
+            w.writeframes(pcm.tobytes())
+        return buffer.getvalue()
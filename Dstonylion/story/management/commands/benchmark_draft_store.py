@@ -0,0 +1,191 @@
+import asyncio, statistics, threading, time
+from collections import Counter
+import redis
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 벤치마크용 세션이 실제 사용자 키와 겹치지 않도록 큰 user_id 사용
+BENCH_USER_ID_BASE = 10 ** 9
+
+
+class Command(BaseCommand):
+    help = "받아쓰기 draft 저장소 soak 테스트: 동기 redis 호출(기존) / DraftStore(async) 의 이벤트 루프 지연 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sessions", type=int, nargs="+", default=[50, 200, 400], help="동시 녹음 세션 수 목록")
+        parser.add_argument("--duration", type=float, default=5.0, help="세션 수/모드마다 측정 시간 (초)")
+        parser.add_argument("--interval-ms", type=float, default=50, help="세션마다 GET+SET 주기")
+        parser.add_argument("--latency-ms", type=float, default=0, help="Redis 앞에 지연 프록시를 두고 왕복마다 추가할 지연")
+        parser.add_argument("--modes", nargs="+", default=["sync", "async"], choices=["sync", "async"])
+
+    def handle(self, *args, **options):
+        proxy = None
+        if options["latency_ms"] > 0:
+            proxy = DelayProxy(settings.REDIS_HOST, settings.REDIS_PORT, options["latency_ms"] / 1000)
+            proxy.start()
+            # DraftStore의 async 풀은 처음 쓸 때 settings 값으로 만들어짐
+            settings.REDIS_HOST, settings.REDIS_PORT = proxy.host, proxy.port
+
+        try:
+            redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, socket_timeout=5).ping()
+        except redis.RedisError as e:
+            raise CommandError(f"Redis에 연결할 수 없습니다: {settings.REDIS_HOST}:{settings.REDIS_PORT} ({e})")
+
+        self.stdout.write(
+            f"GET+SET every {options['interval_ms']:.0f} ms per session,"
+            f" {options['duration']:.0f}s per run, added latency {options['latency_ms']:.1f} ms"
+        )
+        try:
+            asyncio.run(self.run_all(options))
+        finally:
+            if proxy:
+                proxy.stop()
+
+    async def run_all(self, options):
+        for sessions in options["sessions"]:
+            for mode in options["modes"]:
+                lags, ops, errors = await self.soak(mode, sessions, options["duration"], options["interval_ms"] / 1000)
+                lags.sort()
+                p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+                self.stdout.write(
+                    f"{sessions:4d} sessions {mode:5s} | loop lag p50 {statistics.median(lags) * 1000:8.1f} ms"
+                    f" p99 {p99 * 1000:8.1f} ms | {ops / options['duration']:7.0f} ops/s | errors {sum(errors.values())}"
+                )
+                for message, count in errors.most_common():
+                    self.stdout.write(f"    {count} x {message}")
+        await self.cleanup(max(options["sessions"]))
+
+    async def soak(self, mode, sessions, duration, interval):
+        """
+        세션 task들과 lag probe를 duration 동안 돌리고 (lag 목록, 완료한 GET+SET 수, 오류 수) 반환
+        """
+        deadline = time.perf_counter() + duration
+        lags, counters = [], {"ops": 0, "errors": Counter()}
+        worker = self.sync_session if mode == "sync" else self.async_session
+        tasks = [asyncio.create_task(worker(BENCH_USER_ID_BASE + i, interval, deadline, counters)) for i in range(sessions)]
+        await self.lag_probe(deadline, lags)
+        await asyncio.gather(*tasks)
+        return lags, counters["ops"], counters["errors"]
+
+    async def lag_probe(self, deadline, lags, period=0.01):
+        # sleep이 예정보다 늦게 깨어난 만큼이 이벤트 루프가 막혀 있던 시간
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await asyncio.sleep(period)
+            lags.append(time.perf_counter() - started - period)
+
+    async def sync_session(self, user_id, interval, deadline, counters):
+        # 기존 DraftConsumer: 연결마다 StrictRedis를 만들고 async 핸들러에서 그대로 호출
+        client = redis.StrictRedis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0, decode_responses=True)
+        key = f"draft:{user_id}"
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    current = client.get(key) or ""
+                    client.set(key, (current + " 문장.")[-200:])
+                    counters["ops"] += 1
+                except redis.RedisError as e:
+                    counters["errors"][str(e)] += 1
+                await asyncio.sleep(interval)
+        finally:
+            client.close()
+
+    async def async_session(self, user_id, interval, deadline, counters):
+        from story.redis_client import DraftStore
+
+        store = DraftStore(user_id)
+        while time.perf_counter() < deadline:
+            try:
+                current = await store.get()
+                await store.set((current + " 문장.")[-200:])
+                counters["ops"] += 1
+            except redis.RedisError as e:
+                counters["errors"][str(e)] += 1
+            await asyncio.sleep(interval)
+
+    async def cleanup(self, sessions):
+        from story.redis_client import get_async_redis, session_key
+
+        client = get_async_redis()
+        for start in range(0, sessions, 500):
+            ids = range(BENCH_USER_ID_BASE + start, BENCH_USER_ID_BASE + min(sessions, start + 500))
+            await client.delete(*[f"draft:{i}" for i in ids], *[session_key(i) for i in ids])
+        await client.aclose()
+
+
+class DelayProxy:
+    """
+    Redis 앞에 두는 TCP 프록시 - 양방향 데이터를 각각 delay/2 만큼 늦게 전달 (왕복 delay 추가)
+    측정 대상 이벤트 루프와 섞이지 않도록 별도 스레드에서 자체 루프로 실행
+    """
+
+    def __init__(self, upstream_host, upstream_port, delay):
+        self.upstream = (upstream_host, upstream_port)
+        self.delay = delay / 2
+        self.host, self.port = "127.0.0.1", None
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        if not self.ready.wait(10) or self.port is None:
+            raise CommandError("지연 프록시를 시작하지 못했습니다")
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result(10)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(10)
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, self.host, 0))
+            self.port = self.server.sockets[0].getsockname()[1]
+        finally:
+            self.ready.set()
+        self.loop.run_forever()
+        self.loop.close()
+
+    async def shutdown(self):
+        self.server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(*self.upstream)
+        except OSError:
+            client_writer.close()
+            return
+        await asyncio.gather(
+            self.pipe(client_reader, upstream_writer),
+            self.pipe(upstream_reader, client_writer),
+            return_exceptions=True,
+        )
+
+    async def pipe(self, reader, writer):
+        # 읽은 시각 + delay 에 쓰기 (순서 유지, 파이프라인된 요청도 지연이 누적되지 않음)
+        queue = asyncio.Queue()
+
+        async def forward():
+            while True:
+                due, data = await queue.get()
+                if data is None:
+                    break
+                wait = due - self.loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                writer.write(data)
+                await writer.drain()
+
+        forwarder = asyncio.create_task(forward())
+        try:
+            while data := await reader.read(65536):
+                queue.put_nowait((self.loop.time() + self.delay, data))
+        finally:
+            queue.put_nowait((0, None))
+            await forwarder
+            writer.close()
@@ -0,0 +1,91 @@
+import io, os, base64, tempfile, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.management.base import BaseCommand
+
+from story.services.image_service import ingest_b64_image
+
+
+def current_rss_mb():
+    # Linux /proc 기준 현재 RSS (MiB)
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, interval=0.005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss_mb()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak = max(self.peak, current_rss_mb())
+            time.sleep(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return self.peak
+
+
+class Command(BaseCommand):
+    help = "동시 삽화 job 수에 따른 이미지 ingest(디코딩 + 업로드 + WebP 파생 이미지) 최대 RSS 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8], help="동시 job 수 목록")
+        parser.add_argument("--pages", type=int, default=4, help="job당 페이지 수")
+        parser.add_argument("--width", type=int, default=1536)
+        parser.add_argument("--height", type=int, default=1024)
+
+    def handle(self, *args, **options):
+        b64 = self.sample_b64(options["width"], options["height"])
+        self.stdout.write(
+            f"image {options['width']}x{options['height']}, base64 {len(b64) / 2 ** 20:.1f} MiB, "
+            f"page concurrency {settings.ILLUSTRATION_PAGE_CONCURRENCY}, "
+            f"variant concurrency {settings.IMAGE_VARIANT_CONCURRENCY}"
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # S3 지연이 섞이지 않도록 로컬 임시 스토리지에 저장
+            default_storage._wrapped = FileSystemStorage(location=tmp_dir)
+
+            # 운영과 같이 페이지 작업은 ILLUSTRATION_PAGE_CONCURRENCY 크기의 공용 풀에서 실행
+            with ThreadPoolExecutor(max_workers=settings.ILLUSTRATION_PAGE_CONCURRENCY) as page_pool:
+                ingest_b64_image("warmup.png", b64)
+                for jobs in options["jobs"]:
+                    self.run_level(page_pool, b64, jobs, options["pages"])
+
+    def run_level(self, page_pool, b64, jobs, pages):
+        baseline = current_rss_mb()
+        sampler = RssSampler()
+        sampler.start()
+        started = time.perf_counter()
+
+        def render(job, page):
+            # 페이지마다 API 응답 문자열을 따로 받는 상황을 재현 (복사본)
+            data = (b64 + " ")[:-1]
+            ingest_b64_image(f"bench_j{jobs}_{job}_p{page}.png", data)
+
+        futures = [page_pool.submit(render, job, page) for job in range(jobs) for page in range(pages)]
+        for future in futures:
+            future.result()
+
+        elapsed = time.perf_counter() - started
+        peak = sampler.stop()
+        self.stdout.write(
+            f"jobs {jobs:2d} ({jobs * pages:3d} images) | peak RSS +{peak - baseline:6.1f} MiB"
+            f" | {jobs * pages / elapsed:5.1f} images/s"
+        )
+
+    def sample_b64(self, width, height):
+        from PIL import Image
+
+        # 압축이 잘 안 되는 노이즈 이미지로 실제 생성 이미지 크기에 가깝게
+        image = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return base64.b64encode(buffer.getvalue()).decode("ascii")
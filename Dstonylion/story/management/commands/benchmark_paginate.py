@@ -0,0 +1,102 @@
+import io, random, time, tracemalloc
+from itertools import islice
+from django.core.management.base import BaseCommand
+
+from story.services.ingest_service import PAGE_BATCH_SIZE, iter_decoded
+from story.utils import iter_pages, iter_sentences
+
+WORDS = [
+    "옛날", "옛적에", "호랑이가", "떡", "하나", "주면", "안", "잡아먹지", "해님", "달님",
+    "오누이는", "동아줄을", "타고", "하늘로", "올라갔어요", "어머니는", "고개를", "넘어",
+    "집으로", "돌아가고", "있었습니다", "흥부는", "제비의", "다리를", "고쳐", "주었어요",
+]
+
+
+class Command(BaseCommand):
+    help = "긴 한국어 본문의 페이지 분할(iter_pages) 시간/최대 메모리 비교: 전체 split / 문자열 chunk / 디코딩 스트림"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[2, 8, 32], help="본문 크기 목록 (MiB, UTF-8 기준)")
+        parser.add_argument("--encoding", default="utf-8", help="스트림 측정 시 원본 인코딩 (예: cp949)")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        # chardet 첫 호출 시 로드되는 모델 데이터는 측정에서 제외
+        list(iter_decoded(io.BytesIO("워밍업 문장입니다.".encode(options["encoding"]))))
+
+        for size in options["sizes"]:
+            text = self.sample_text(size)
+            raw = text.encode(options["encoding"])
+
+            # chunk_size를 본문 길이로 주면 예전처럼 본문 전체를 한 번에 split
+            whole = self.measure(lambda: iter_pages_chunked(text, len(text)))
+            chunked = self.measure(lambda: iter_pages(text))
+            streamed = self.measure(lambda: iter_pages(DecodedStream(iter_decoded(io.BytesIO(raw)))))
+
+            assert whole[0] == chunked[0] == streamed[0]
+            self.stdout.write(
+                f"{size:3d} MiB, {whole[0]} pages"
+                f" | whole split {whole[1]:5.2f}s peak {whole[2]:7.1f} MiB"
+                f" | str chunks {chunked[1]:5.2f}s peak {chunked[2]:5.1f} MiB"
+                f" | decoded stream {streamed[1]:5.2f}s peak {streamed[2]:5.1f} MiB"
+            )
+
+    def measure(self, make_pages):
+        """
+        ingest_story처럼 PAGE_BATCH_SIZE개씩 소비하며 (페이지 수, 초, 최대 추가 메모리 MiB) 반환
+        """
+        tracemalloc.start()
+        started = time.perf_counter()
+        pages = make_pages()
+        count = 0
+        while True:
+            batch = list(islice(pages, PAGE_BATCH_SIZE))
+            if not batch:
+                break
+            count += len(batch)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return count, elapsed, peak / 2 ** 20
+
+    def sample_text(self, size_mb):
+        parts, size = [], 0
+        while size < size_mb * 2 ** 20:
+            sentence = " ".join(random.choices(WORDS, k=random.randint(3, 10))) + random.choice(".!?")
+            sentence += random.choice([" ", " ", "\n"])
+            parts.append(sentence)
+            size += len(sentence.encode("utf-8"))
+        return "".join(parts)
+
+
+def iter_pages_chunked(text, chunk_size):
+    # iter_pages와 같은 3문장 페이지를 주어진 chunk 크기로 만듦 (비교 기준)
+    sentences = iter_sentences(text, chunk_size)
+    while True:
+        page = list(islice(sentences, 3))
+        if not page:
+            return
+        yield " ".join(page)
+
+
+class DecodedStream:
+    """
+    iter_decoded가 내주는 문자열 조각을 read()로 읽을 수 있게 감싼 텍스트 스트림
+    """
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.buffer = ""
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if size < 0:
+            data, self.buffer = self.buffer, ""
+        else:
+            data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
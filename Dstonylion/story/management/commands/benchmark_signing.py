@@ -0,0 +1,72 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from stonylion.storages import MediaStorage
+
+
+class Command(BaseCommand):
+    help = "S3 서명 URL 비용 비교: 매번 서명(기존) / MediaStorage.url 캐시 / bulk_url"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keys", type=int, default=200, help="한 번에 서명할 파일 수 (페이지 목록 1회 분량)")
+        parser.add_argument("--rounds", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+
+    def handle(self, *args, **options):
+        storage = self.make_storage()
+        names = [f"illustrations/bench/page_{i:04d}.png" for i in range(options["keys"])]
+        rounds = options["rounds"]
+
+        def uncached():
+            # 캐시 도입 전: 파일마다 SigV4 서명
+            for name in names:
+                S3Boto3Storage.url(storage, name)
+
+        def url_cold():
+            MediaStorage._signed_url_cache.clear()
+            for name in names:
+                storage.url(name)
+
+        def url_warm():
+            for name in names:
+                storage.url(name)
+
+        def bulk_cold():
+            MediaStorage._signed_url_cache.clear()
+            storage.bulk_url(names)
+
+        def bulk_warm():
+            storage.bulk_url(names)
+
+        self.stdout.write(f"{len(names)} keys, median of {rounds} rounds")
+        for label, fn in (
+            ("per-call signing (before)", uncached),
+            ("url() cache miss", url_cold),
+            ("url() cache hit", url_warm),
+            ("bulk_url() cache miss", bulk_cold),
+            ("bulk_url() cache hit", bulk_warm),
+        ):
+            elapsed = self.median(fn, rounds)
+            self.stdout.write(
+                f"{label:28s} {elapsed * 1000:8.2f} ms ({elapsed / len(names) * 1e6:7.1f} us/key)"
+            )
+        MediaStorage._signed_url_cache.clear()
+
+    def make_storage(self):
+        # 서명은 네트워크 없이 로컬에서 계산되므로 자격 증명이 없으면 더미 값으로 측정
+        overrides = {}
+        if not settings.AWS_ACCESS_KEY_ID or not settings.AWS_SECRET_ACCESS_KEY:
+            overrides.update(access_key="benchmark", secret_key="benchmark")
+        if not settings.AWS_STORAGE_BUCKET_NAME:
+            overrides["bucket_name"] = "stonylion-benchmark"
+        return MediaStorage(**overrides)
+
+    def median(self, fn, rounds):
+        fn()  # 클라이언트 생성 등 첫 호출 비용 제외
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+        return sorted(samples)[len(samples) // 2]
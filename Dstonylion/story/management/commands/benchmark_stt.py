@@ -0,0 +1,62 @@
+import time, statistics
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+
+from story.services.stt_service import STT_BACKENDS, get_whisper_model, transcribe_api, transcribe_local
+
+# transcribe()는 로컬 실패 시 STT_API_FALLBACK으로 API를 쓰므로, 측정은 백엔드 함수를 직접 호출
+BACKEND_FUNCTIONS = {"local": transcribe_local, "openai": transcribe_api}
+
+
+class Command(BaseCommand):
+    help = "STT 백엔드(local faster-whisper / openai API)의 지연 시간과 처리량 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument("audio", nargs="+", help="측정에 쓸 음성 파일 경로")
+        parser.add_argument("--backends", nargs="+", default=list(STT_BACKENDS), choices=STT_BACKENDS)
+        parser.add_argument("--repeat", type=int, default=3, help="파일당 반복 횟수")
+        parser.add_argument("--concurrency", type=int, default=4, help="처리량 측정 시 동시 요청 수")
+
+    def handle(self, *args, **options):
+        audio_files = options["audio"]
+        total_audio = sum(self.audio_seconds(path) for path in audio_files)
+        requests = audio_files * options["repeat"]
+
+        for backend in options["backends"]:
+            run = BACKEND_FUNCTIONS[backend]
+            if backend == "local":
+                # 모델 로드 시간은 측정에서 제외, 로드 실패 시 API로 넘어가지 않고 중단
+                try:
+                    get_whisper_model()
+                except Exception as e:
+                    raise CommandError(f"로컬 faster-whisper 모델을 로드할 수 없습니다: {e}")
+
+            try:
+                latencies = []
+                for path in requests:
+                    started = time.perf_counter()
+                    run(path)
+                    latencies.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+                    list(executor.map(run, requests))
+                concurrent_elapsed = time.perf_counter() - started
+            except Exception as e:
+                raise CommandError(f"{backend} 인식 실패: {e}")
+
+            rtf = sum(latencies) / (total_audio * options["repeat"])
+            p95 = sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)]
+            self.stdout.write(
+                f"{backend:6s} | p50 {statistics.median(latencies) * 1000:.0f}ms"
+                f" | p95 {p95 * 1000:.0f}ms | RTF {rtf:.3f}"
+                f" | {len(requests) / concurrent_elapsed:.2f} req/s (x{options['concurrency']})"
+            )
+
+    def audio_seconds(self, path):
+        from faster_whisper import decode_audio
+
+        try:
+            return len(decode_audio(path)) / 16000
+        except Exception as e:
+            raise CommandError(f"음성 파일을 읽을 수 없습니다: {path} ({e})")
@@ -0,0 +1,65 @@
+import os, time, tempfile
+from django.core.management.base import BaseCommand, CommandError
+
+from story.models import StoryPage
+from story.services.openvoice_service import (
+    InferenceDisabledError, get_tts_model, generate_tts, generate_tts_batch_to_files,
+)
+
+
+class Command(BaseCommand):
+    help = "페이지별 generate_tts 반복과 generate_tts_batch의 실시간 배율(RTF) 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--story", type=int, help="페이지 텍스트를 가져올 동화 id (없으면 예시 문장 사용)")
+        parser.add_argument("--pages", type=int, default=20)
+        parser.add_argument("--language", default="KR")
+        parser.add_argument("--speed", type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        texts = self.load_texts(options["story"], options["pages"])
+        language, speed = options["language"], options["speed"]
+
+        try:
+            # 모델 로드 시간은 측정에서 제외
+            model = get_tts_model(language)
+        except InferenceDisabledError as e:
+            raise CommandError(str(e))
+        sampling_rate = model.hps.data.sampling_rate
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            loop_paths = [os.path.join(tmp_dir, f"loop_{i}.wav") for i in range(len(texts))]
+            started = time.perf_counter()
+            for text, path in zip(texts, loop_paths):
+                generate_tts(language, text, path, speed=speed)
+            loop_elapsed = time.perf_counter() - started
+
+            batch_paths = [os.path.join(tmp_dir, f"batch_{i}.wav") for i in range(len(texts))]
+            started = time.perf_counter()
+            generate_tts_batch_to_files(language, [(text, speed, path) for text, path in zip(texts, batch_paths)])
+            batch_elapsed = time.perf_counter() - started
+
+            loop_audio = self.audio_seconds(loop_paths, sampling_rate)
+            batch_audio = self.audio_seconds(batch_paths, sampling_rate)
+
+        self.stdout.write(f"pages: {len(texts)}")
+        self.stdout.write(f"loop : {loop_elapsed:.2f}s / audio {loop_audio:.2f}s / RTF {loop_elapsed / loop_audio:.3f}")
+        self.stdout.write(f"batch: {batch_elapsed:.2f}s / audio {batch_audio:.2f}s / RTF {batch_elapsed / batch_audio:.3f}")
+        self.stdout.write(f"speedup: {loop_elapsed / batch_elapsed:.2f}x")
+
+    def load_texts(self, story_id, pages):
+        if story_id:
+            texts = list(
+                StoryPage.objects.filter(story_id=story_id)
+                .order_by("page_number")
+                .values_list("text", flat=True)[:pages]
+            )
+            if not texts:
+                raise CommandError(f"동화 {story_id}의 페이지가 없습니다.")
+            return texts
+        sample = "옛날 옛적 깊은 숲속에 작은 토끼가 살았어요. 토끼는 매일 아침 친구들과 함께 산책을 했답니다."
+        return [sample] * pages
+
+    def audio_seconds(self, paths, sampling_rate):
+        import soundfile
+        return sum(soundfile.info(path).frames for path in paths) / sampling_rate
@@ -0,0 +1,134 @@
+import os, time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED
+import boto3
+from botocore.config import Config
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from story.models import Story
+from story.utils import iter_pages
+from story.services.ingest_service import ENCODING_SAMPLE_SIZE, ingest_story, read_text, replace_story_pages
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "S3 prefix 아래의 명작동화 txt 파일을 병렬로 일괄 import (ETag가 같은 파일은 건너뜀)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", required=True, help="동화 소유자 username")
+        parser.add_argument("--prefix", default="media/stories/", help="버킷 내 S3 prefix")
+        parser.add_argument("--author", default="Unknown")
+        parser.add_argument("--workers", type=int, default=8, help="동시 다운로드 수")
+        parser.add_argument("--max-in-flight", type=int, default=0, help="동시에 메모리에 둘 본문 수 (기본: workers x 2)")
+        parser.add_argument("--sample-size", type=int, default=ENCODING_SAMPLE_SIZE)
+        parser.add_argument("--dry-run", action="store_true", help="변경 대상만 출력")
+
+    def handle(self, *args, **options):
+        try:
+            self.user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"사용자 {options['user']}를 찾을 수 없습니다.")
+
+        self.bucket = settings.AWS_STORAGE_BUCKET_NAME
+        self.author = options["author"]
+        self.sample_size = options["sample_size"]
+        # 다운로드 스레드 수만큼 커넥션을 재사용하는 클라이언트 하나를 공유
+        self.s3 = boto3.client(
+            "s3",
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_S3_REGION_NAME,
+            config=Config(max_pool_connections=options["workers"]),
+        )
+
+        started = time.perf_counter()
+        stats = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+        paginator = self.s3.get_paginator("list_objects_v2")
+
+        # 동시에 메모리에 올라가는 본문 수 상한
+        window = options["max_in_flight"] or options["workers"] * 2
+        in_flight = {}
+        existing_by_key = {}
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            # 목록 한 페이지(최대 1000개)씩 변경분만 내려받아 저장
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=options["prefix"]):
+                objects = [
+                    {"key": obj["Key"], "etag": obj["ETag"].strip('"')}
+                    for obj in page.get("Contents", [])
+                    if obj["Key"].lower().endswith(".txt")
+                ]
+                existing = {
+                    story.source_key: story
+                    for story in Story.objects.filter(source_key__in=[o["key"] for o in objects])
+                }
+
+                changed = [o for o in objects if getattr(existing.get(o["key"]), "source_etag", None) != o["etag"]]
+                stats["skipped"] += len(objects) - len(changed)
+
+                if options["dry_run"]:
+                    for obj in changed:
+                        self.stdout.write(f"{'update' if obj['key'] in existing else 'create'}: {obj['key']}")
+                    continue
+
+                # 갱신 대상 Story만 저장 시점까지 보관 (저장하면 제거)
+                existing_by_key.update({o["key"]: existing[o["key"]] for o in changed if o["key"] in existing})
+                for obj in changed:
+                    # 다운로드 중이거나 저장 대기 중인 본문 수를 window 이하로 유지 (메모리 상한)
+                    while len(in_flight) >= window:
+                        self.drain(in_flight, existing_by_key, stats, FIRST_COMPLETED)
+                    in_flight[executor.submit(self.fetch_text, obj["key"])] = obj
+
+            self.drain(in_flight, existing_by_key, stats, ALL_COMPLETED)
+
+        self.stdout.write(
+            "created {created} / updated {updated} / skipped {skipped} / failed {failed}".format(**stats)
+            + f" ({time.perf_counter() - started:.1f}s)"
+        )
+
+    def drain(self, in_flight, existing, stats, return_when):
+        """
+        완료된 다운로드를 바로 저장하고 in_flight에서 제거 (본문 참조를 즉시 해제)
+        """
+        done, _ = wait(in_flight, return_when=return_when)
+        for future in done:
+            obj = in_flight.pop(future)
+            try:
+                created = self.save_story(obj, future.result(), existing.pop(obj["key"], None))
+                stats["created" if created else "updated"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                self.stderr.write(f"실패: {obj['key']} ({e})")
+
+    def fetch_text(self, key):
+        # S3 body를 chunk 단위로 디코딩 (원본 바이트 전체를 따로 들고 있지 않음)
+        body = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
+        try:
+            return read_text(body, self.sample_size)
+        finally:
+            body.close()
+
+    def save_story(self, obj, text, story=None):
+        """
+        새 파일이면 생성(True), ETag가 바뀐 파일이면 본문/페이지 갱신(False)
+        페이지는 본문을 chunk 단위로 나눠가며 batch마다 저장
+        """
+        pages = iter_pages(text)
+        fields = {"content": text, "source_etag": obj["etag"]}
+
+        if story:
+            replace_story_pages(story, pages, **fields)
+            return False
+
+        ingest_story(
+            pages,
+            user=self.user,
+            title=os.path.splitext(os.path.basename(obj["key"]))[0],
+            author=self.author,
+            category="classic",
+            source_key=obj["key"],
+            **fields,
+        )
+        return True
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+
+from story.services.inference_server import run_server
+from story.services.openvoice_service import InferenceDisabledError
+
+
+class Command(BaseCommand):
+    help = "OpenVoice/MeloTTS 모델을 소유하는 로컬 추론 서버 실행 (Unix 소켓)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--socket", default=settings.INFERENCE_SERVER_SOCKET or "/tmp/stonylion-inference.sock")
+        parser.add_argument("--preload", nargs="*", default=["KR"], help="시작 시 미리 로드할 TTS 언어")
+
+    def handle(self, *args, **options):
+        try:
+            run_server(options["socket"], options["preload"])
+        except InferenceDisabledError as e:
+            raise CommandError(str(e))
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('story', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='illustrations',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='cover_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
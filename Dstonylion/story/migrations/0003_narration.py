@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:15
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_alter_clonedvoice_voice_name'),
+        ('story', '0002_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NarrationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('speed', models.FloatField(default=1.0)),
+                ('status', models.CharField(default='PENDING', max_length=20)),
+                ('total_pages', models.PositiveIntegerField(default=0)),
+                ('completed_pages', models.PositiveIntegerField(default=0)),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='narration_jobs', to='story.story')),
+                ('voice', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='narration_jobs', to='accounts.clonedvoice')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='NarrationAudio',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text_hash', models.CharField(max_length=64)),
+                ('speed', models.FloatField(default=1.0)),
+                ('audio', models.FileField(upload_to='narrations/')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('voice', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='narration_audios', to='accounts.clonedvoice')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['text_hash', 'voice', 'speed'], name='story_narra_text_ha_a6885e_idx')],
+            },
+        ),
+    ]
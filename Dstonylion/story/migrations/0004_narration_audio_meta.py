@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('story', '0003_narration'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='narrationaudio',
+            name='audio_meta',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
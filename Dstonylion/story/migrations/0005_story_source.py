@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('story', '0004_narration_audio_meta'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='story',
+            name='source_etag',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='source_key',
+            field=models.CharField(blank=True, db_index=True, max_length=512, null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_clonedvoice_meta'),
+        ('story', '0005_story_source'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['-created_at', '-id'], name='story_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='story_cat_created_id_idx'),
+        ),
+    ]
@@ -25,6 +25,7 @@ class Story(models.Model):
     title = models.CharField(max_length=200)
     author = models.CharField(max_length=50)
     cover = models.ImageField(upload_to='stories/', null=True)
+    cover_variants = models.JSONField(default=dict, blank=True)  # 표지 WebP 파생 이미지 경로
     content = models.TextField()
 
     page_count = models.IntegerField(default=0)
@@ -34,9 +35,20 @@ class Story(models.Model):
 
     morals = models.ManyToManyField(MoralTheme, related_name="stories", blank=True)
 
+    # S3 일괄 import된 명작동화의 원본 위치 / ETag (변경되지 않은 파일은 다시 import하지 않음)
+    source_key = models.CharField(max_length=512, null=True, blank=True, db_index=True)
+    source_etag = models.CharField(max_length=64, null=True, blank=True)
+
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
     updated_at = models.DateTimeField(default=timezone.now, db_index=True)
 
+    class Meta:
+        # 목록 cursor 페이지네이션용 (created_at, id) 정렬 인덱스
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="story_created_id_idx"),
+            models.Index(fields=["category", "-created_at", "-id"], name="story_cat_created_id_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -52,6 +64,7 @@ class StoryPage(models.Model):
 class Illustrations(models.Model):
     story_page = models.ForeignKey(StoryPage, on_delete=models.CASCADE, related_name="illustrations")
     image = models.ImageField(upload_to='illustrations/')
+    variants = models.JSONField(default=dict, blank=True)  # {"thumb": 경로, "medium": 경로, "full": 경로}
     prompt = models.TextField()
     style = models.CharField(max_length=100, null=True, blank=True)
     created_at = models.DateTimeField(default=timezone.now, db_index=True)
@@ -59,6 +72,33 @@ class Illustrations(models.Model):
     def __str__(self):
         return f"{self.story_page.story.title}(p.{self.story_page.page_number}) 삽화"
 
+class NarrationJob(models.Model):
+    story = models.ForeignKey(Story, on_delete=models.CASCADE, related_name="narration_jobs")
+    voice = models.ForeignKey(ClonedVoice, on_delete=models.SET_NULL, null=True, blank=True, related_name="narration_jobs")
+    speed = models.FloatField(default=1.0)
+    status = models.CharField(max_length=20, default="PENDING")  # PENDING, RUNNING, SUCCESS, FAILED
+    total_pages = models.PositiveIntegerField(default=0)
+    completed_pages = models.PositiveIntegerField(default=0)
+    error_message = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Narration for {self.story.title} ({self.status})"
+
+class NarrationAudio(models.Model):
+    # (페이지 텍스트 해시, 목소리, 속도) 단위 음성 캐시 - 같은 텍스트는 다시 합성하지 않음
+    text_hash = models.CharField(max_length=64)
+    voice = models.ForeignKey(ClonedVoice, on_delete=models.CASCADE, null=True, blank=True, related_name="narration_audios")
+    speed = models.FloatField(default=1.0)
+    audio = models.FileField(upload_to="narrations/")
+    audio_meta = models.JSONField(default=dict, blank=True)  # {"codec", "bitrate", "duration", "sample_rate", "size", "source"(wav 보관 시)}
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=["text_hash", "voice", "speed"])]
+
 class StoryLike(models.Model):
     story = models.ForeignKey(Story, on_delete=models.CASCADE, related_name="likes")
     child = models.ForeignKey(Child, on_delete=models.CASCADE, related_name="likes")
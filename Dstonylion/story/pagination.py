@@ -0,0 +1,143 @@
+#목록 API 공통 keyset(cursor) 페이지네이션
+import base64, json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    cursor → [정렬 값, tiebreaker(int)]
+    정렬 값은 필드에 맞는지 KeysetPagination에서 다시 검사
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor("잘못된 cursor입니다.")
+    if not isinstance(values, list) or len(values) != 2:
+        raise InvalidCursor("잘못된 cursor입니다.")
+
+    value, key = values
+    try:
+        if isinstance(key, (bool, float)):
+            raise TypeError(key)
+        key = int(key)
+    except (ValueError, TypeError):
+        raise InvalidCursor("잘못된 cursor입니다.")
+    return [value, key]
+
+
+def _resolve(obj, field):
+    # "story__created_at" 같은 관계 경로도 객체 속성으로 따라감
+    for part in field.split("__"):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _model_field(model, path):
+    # 관계 경로를 따라가 마지막 모델 필드 반환 ("story_id" 같은 attname도 허용)
+    parts = path.split("__")
+    for part in parts[:-1]:
+        model = model._meta.get_field(part).related_model
+    return model._meta.get_field(parts[-1])
+
+
+class KeysetPagination:
+    """
+    (field, tiebreaker) 내림차순 keyset 페이지네이션
+    OFFSET 없이 마지막 행의 값 이후만 조회하므로 몇 번째 페이지든 비용이 같고,
+    같은 값이 여러 행이어도 tiebreaker(고유값)로 순서가 고정됨
+
+    field가 NULL인 행은 맨 뒤에 옴. NULL 행과 값이 있는 행을 한 쿼리의 OR 조건으로 섞으면
+    (조건 필드, field, tiebreaker) 인덱스를 범위 스캔하지 못하므로 두 구간으로 나눠 조회
+      1) field IS NOT NULL: field <= 값 범위 + (field, tiebreaker) 역순
+      2) field IS NULL: tiebreaker < 키 범위 + tiebreaker 역순 (1에서 페이지가 덜 찼을 때만)
+    """
+
+    def __init__(self, field, tiebreaker="id"):
+        self.field = field
+        self.tiebreaker = tiebreaker
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+        except (TypeError, ValueError):
+            size = DEFAULT_PAGE_SIZE
+        return max(1, min(size, MAX_PAGE_SIZE))
+
+    def parse_cursor(self, cursor, model):
+        """
+        cursor의 정렬 값을 필드 타입으로 변환, 맞지 않으면 InvalidCursor
+        """
+        value, key = decode_cursor(cursor)
+        field = _model_field(model, self.field)
+        if value is None:
+            if not field.null:
+                raise InvalidCursor("잘못된 cursor입니다.")
+            return None, key
+        if not isinstance(value, (str, int)) or isinstance(value, bool):
+            raise InvalidCursor("잘못된 cursor입니다.")
+        try:
+            return field.to_python(value), key
+        except (ValidationError, TypeError, ValueError):
+            raise InvalidCursor("잘못된 cursor입니다.")
+
+    def filled(self, queryset, values, limit):
+        # 값이 있는 구간: field <= value 범위 스캔 후 같은 값이면 tiebreaker로 이어감
+        value, key = values
+        queryset = queryset.filter(**{f"{self.field}__isnull": False})
+        if value is not None:
+            queryset = queryset.filter(
+                Q(**{f"{self.field}__lt": value}) | Q(**{f"{self.tiebreaker}__lt": key}),
+                **{f"{self.field}__lte": value},
+            )
+        ordering = dict.fromkeys([f"-{self.field}", f"-{self.tiebreaker}"])
+        return list(queryset.order_by(*ordering)[:limit])
+
+    def nulls(self, queryset, key, limit):
+        queryset = queryset.filter(**{f"{self.field}__isnull": True})
+        if key is not None:
+            queryset = queryset.filter(**{f"{self.tiebreaker}__lt": key})
+        return list(queryset.order_by(f"-{self.tiebreaker}")[:limit])
+
+    def paginate(self, queryset, request):
+        """
+        (현재 페이지 객체 목록, next_cursor) 반환, 다음 페이지가 없으면 next_cursor는 None
+        """
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get("cursor")
+        values = self.parse_cursor(cursor, queryset.model) if cursor else (None, None)
+        nullable = _model_field(queryset.model, self.field).null
+
+        # 한 개 더 가져와서 다음 페이지 존재 여부 판단 (count() 불필요)
+        limit = page_size + 1
+        items = []
+        if not cursor or values[0] is not None:
+            items = self.filled(queryset, values, limit)
+        if nullable and len(items) < limit:
+            # 값이 있는 구간을 다 넘겼으면 NULL 구간 (cursor가 NULL 구간 안이면 그 키 이후부터)
+            key = values[1] if cursor and values[0] is None else None
+            items += self.nulls(queryset, key, limit - len(items))
+
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            value = _resolve(last, self.field)
+            next_cursor = encode_cursor([
+                value.isoformat() if hasattr(value, "isoformat") else value,
+                _resolve(last, self.tiebreaker),
+            ])
+        return items, next_cursor
@@ -0,0 +1,140 @@
+# 동화 생성 흐름에서 쓰는 Redis 접근을 한 곳으로 모음
+# 연결마다 클라이언트를 만들지 않고 프로세스 전체가 커넥션 풀 하나를 공유
+import re
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+
+_sync_pool = redis.ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=0,
+    decode_responses=True,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+)
+_async_pool = None
+
+
+def get_redis():
+    """
+    동기 Redis 클라이언트 (API 뷰용, 프로세스 공용 풀)
+    """
+    return redis.Redis(connection_pool=_sync_pool)
+
+
+def get_async_redis():
+    """
+    redis.asyncio 클라이언트 (프로세스 공용 풀, 이벤트 루프를 막지 않음)
+    """
+    global _async_pool
+    if _async_pool is None:
+        # 한 루프에서 여러 연결이 동시에 명령을 보내므로 max_connections를 넘으면
+        # "Too many connections" 오류 대신 빈 커넥션이 생길 때까지 대기
+        _async_pool = aioredis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=0,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+        )
+    return aioredis.Redis(connection_pool=_async_pool)
+
+
+def session_key(user_id):
+    # 동화 생성 흐름 상태는 사용자당 hash 하나에 모두 저장
+    # (runtime, age_group / dictation: 받아쓰기 누적 / draft: 최종 텍스트 / selected_ids, custom_morals)
+    return f"story_session:{user_id}"
+
+
+# 받아쓰기 결과를 서버에서 원자적으로 이어 붙이고 TTL 갱신 (새 텍스트만 전송, save_text와 경쟁 없음)
+# 마지막 문장이 .?! 로 끝나지 않으면 ". "을 붙인 뒤 이어 붙임
+APPEND_DICTATION_LUA = """
+local existing = redis.call('HGET', KEYS[1], 'dictation') or ''
+if existing ~= '' and not existing:sub(-1):match('[%.%?!]') then
+    existing = existing .. '. '
+end
+local updated = (existing .. ' ' .. ARGV[1]):match('^%s*(.-)%s*$')
+redis.call('HSET', KEYS[1], 'dictation', updated)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return string.len(updated)
+"""
+
+
+class DraftStore:
+    """
+    받아쓰기(DraftConsumer) draft 텍스트 저장소 - 세션 hash의 dictation 필드
+    """
+
+    def __init__(self, user_id):
+        self.key = session_key(user_id)
+        self.ttl = settings.STORY_SESSION_TTL
+        self.redis = get_async_redis()
+        self._append = self.redis.register_script(APPEND_DICTATION_LUA)
+
+    async def get(self):
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hget(self.key, "dictation")
+        pipe.expire(self.key, self.ttl)
+        text, _ = await pipe.execute()
+        return text or ""
+
+    async def set(self, text):
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(self.key, "dictation", text)
+        pipe.expire(self.key, self.ttl)
+        await pipe.execute()
+
+    async def append(self, new_text):
+        await self._append(keys=[self.key], args=[new_text, self.ttl])
+
+    async def last_sentences(self, n):
+        full = await self.get()
+        sentences = re.split(r'(?<=[.!?])\s+', full)
+        return " ".join(sentences[-n:]).strip()
+
+
+class StorySessionStore:
+    """
+    동화 생성 흐름(옵션 → draft → 교훈 → 생성) 상태 저장소
+    쓰기/조회마다 TTL을 갱신하므로 중간에 이탈한 세션은 STORY_SESSION_TTL 후 자동 삭제
+    """
+
+    def __init__(self, user_id):
+        self.key = session_key(user_id)
+        self.ttl = settings.STORY_SESSION_TTL
+        self.redis = get_redis()
+
+    def _save(self, mapping):
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(self.key, mapping=mapping)
+        pipe.expire(self.key, self.ttl)
+        pipe.execute()
+
+    def save_option(self, runtime, age_group):
+        self._save({"runtime": runtime, "age_group": age_group})
+
+    def save_draft(self, text):
+        self._save({"draft": text})
+
+    def save_morals(self, selected_ids, custom_morals):
+        self._save({
+            "selected_ids": ",".join(map(str, selected_ids)),
+            "custom_morals": ",".join(custom_morals)
+        })
+
+    def load(self):
+        """
+        {"option": dict, "draft": str | None, "morals": dict}
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(self.key)
+        pipe.expire(self.key, self.ttl)
+        session, _ = pipe.execute()
+
+        option = {k: session[k] for k in ("runtime", "age_group") if k in session}
+        morals = {k: session[k] for k in ("selected_ids", "custom_morals") if k in session}
+        return {"option": option, "draft": session.get("draft"), "morals": morals}
+
+    def clear(self):
+        self.redis.delete(self.key)
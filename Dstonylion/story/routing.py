@@ -3,4 +3,5 @@ from .consumers import *
 
 websocket_urlpatterns = [
     path("ws/story/record/", DraftConsumer.as_asgi(), name="draft-stt"),
+    path("ws/story/<int:story_id>/narration/stream/", NarrationStreamConsumer.as_asgi(), name="narration-stream"),
 ]
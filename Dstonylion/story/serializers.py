@@ -1,10 +1,24 @@
 from rest_framework import serializers
 from .models import *
+from .services.image_service import variant_urls
 
 class IllustrationSerializer(serializers.ModelSerializer):
+    # context["signed_urls"]에 bulk 서명된 URL이 있으면 재사용
+    image = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Illustrations
-        fields = ["id", "image", "style", "created_at"]
+        fields = ["id", "image", "image_srcset", "style", "created_at"]
+
+    def get_image(self, obj):
+        if not obj.image:
+            return None
+        signed_urls = self.context.get("signed_urls") or {}
+        return signed_urls.get(obj.image.name) or obj.image.url
+
+    def get_image_srcset(self, obj):
+        return variant_urls(obj.variants, self.context.get("signed_urls"))
 
 class StoryPageSerializer(serializers.ModelSerializer):
     illustrations = IllustrationSerializer(many=True, read_only=True)
@@ -19,15 +33,25 @@ class StoryScriptSerializer(serializers.ModelSerializer):
         fields = ["id", "page_number", "text"]
 
 class StorySerializer(serializers.ModelSerializer):
+    cover_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Story
-        fields = ["id", "title", "author", "content", "category",
+        fields = ["id", "title", "author", "content", "category", "cover_srcset",
             "runtime", "age_group", "morals", "created_at", "updated_at"]
 
+    def get_cover_srcset(self, obj):
+        return variant_urls(obj.cover_variants)
+
 class StoryInfoSerializer(serializers.ModelSerializer):
+    cover_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Story
-        fields = ["id", "title", "author", "category", "runtime", "age_group", "morals", "created_at", "updated_at"]
+        fields = ["id", "title", "author", "category", "cover_srcset", "runtime", "age_group", "morals", "created_at", "updated_at"]
+
+    def get_cover_srcset(self, obj):
+        return variant_urls(obj.cover_variants)
 
 class StoryDraftSerializer(serializers.Serializer):
     draft_text = serializers.CharField(required=False, allow_blank=True)
@@ -35,4 +59,11 @@ class StoryDraftSerializer(serializers.Serializer):
 class MoralThemeSerializer(serializers.ModelSerializer):
     class Meta:
         model = MoralTheme
-        fields = ["id", "key", "name"]
\ No newline at end of file
+        fields = ["id", "key", "name"]
+
+class NarrationJobSerializer(serializers.ModelSerializer):
+    story_title = serializers.ReadOnlyField(source="story.title")
+
+    class Meta:
+        model = NarrationJob
+        fields = ["id", "story_title", "voice", "speed", "status", "total_pages", "completed_pages", "error_message", "created_at", "finished_at"]
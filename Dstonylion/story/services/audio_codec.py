@@ -0,0 +1,79 @@
+import io, os
+import av
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+# 코덱별 인코더/컨테이너 설정 (Opus는 48kHz만 지원)
+AUDIO_CODECS = {
+    "opus": {"encoder": "libopus", "container": "ogg", "ext": "ogg", "rate": 48000},
+    "aac": {"encoder": "aac", "container": "mp4", "ext": "m4a", "rate": 44100},
+}
+
+
+def codec_bitrate(codec):
+    return settings.AUDIO_AAC_BITRATE if codec == "aac" else settings.AUDIO_OPUS_BITRATE
+
+
+def _encode(source, target, codec, bitrate):
+    spec = AUDIO_CODECS[codec]
+
+    with av.open(source, "r") as src, av.open(target, "w", format=spec["container"]) as dst:
+        in_stream = src.streams.audio[0]
+        out_stream = dst.add_stream(spec["encoder"], rate=spec["rate"], layout="mono")
+        out_stream.bit_rate = bitrate
+
+        # 인코더가 요구하는 sample format/rate/frame 크기로 맞춤
+        resampler = av.AudioResampler(
+            format=out_stream.format.name,
+            layout="mono",
+            rate=spec["rate"],
+            frame_size=out_stream.codec_context.frame_size or None,
+        )
+        samples = 0
+        for frame in src.decode(in_stream):
+            for resampled in resampler.resample(frame):
+                samples += resampled.samples
+                dst.mux(out_stream.encode(resampled))
+        for resampled in resampler.resample(None):
+            samples += resampled.samples
+            dst.mux(out_stream.encode(resampled))
+        dst.mux(out_stream.encode(None))
+
+    return {
+        "codec": codec,
+        "bitrate": bitrate,
+        "sample_rate": spec["rate"],
+        "duration": round(samples / spec["rate"], 3),
+    }
+
+
+def encode_audio(input_path, codec=None, bitrate=None):
+    """
+    wav 파일을 Opus(ogg) / AAC(m4a)로 인코딩해 (bytes, meta) 반환
+    meta: codec, bitrate, sample_rate, duration(초), size
+    """
+    codec = codec or settings.AUDIO_CODEC
+    bitrate = bitrate or codec_bitrate(codec)
+
+    buffer = io.BytesIO()
+    meta = _encode(input_path, buffer, codec, bitrate)
+    data = buffer.getvalue()
+    meta["size"] = len(data)
+    return data, meta
+
+
+def store_encoded_audio(input_path, name_base, codec=None):
+    """
+    생성된 wav를 인코딩해 {name_base}.{ext}로 저장하고 (저장 경로, meta) 반환
+    AUDIO_KEEP_WAV가 켜진 경우에만 원본 wav도 {name_base}.wav로 저장하고 meta["source"]에 기록
+    """
+    codec = codec or settings.AUDIO_CODEC
+    data, meta = encode_audio(input_path, codec)
+    path = default_storage.save(f"{name_base}.{AUDIO_CODECS[codec]['ext']}", ContentFile(data))
+
+    if settings.AUDIO_KEEP_WAV:
+        with open(input_path, "rb") as f:
+            meta["source"] = default_storage.save(f"{name_base}.wav", File(f, name=os.path.basename(input_path)))
+    return path, meta
@@ -0,0 +1,110 @@
+import os, base64, tempfile, threading
+from PIL import Image
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+# 4의 배수여야 조각마다 독립적으로 디코딩 가능
+B64_CHUNK_SIZE = 64 * 1024
+
+# 파생 이미지 라벨 → 최대 가로 폭(px)
+IMAGE_VARIANTS = {
+    "thumb": 320,
+    "medium": 768,
+    "full": 1536,
+}
+
+# 파생 이미지는 원본 비트맵 전체를 디코딩하므로 프로세스 전체에서 동시에 만드는 개수를 제한
+# (동시 job 수가 늘어도 디코딩된 비트맵 메모리는 이 값에 묶임)
+_variant_slots = threading.BoundedSemaphore(settings.IMAGE_VARIANT_CONCURRENCY)
+
+
+def _decode_b64_to_file(b64_data, fileobj):
+    for start in range(0, len(b64_data), B64_CHUNK_SIZE):
+        fileobj.write(base64.b64decode(b64_data[start:start + B64_CHUNK_SIZE]))
+    fileobj.seek(0)
+
+
+def ingest_b64_image(name, b64_data):
+    """
+    base64 이미지 문자열을 조각 단위로 디코딩해 임시 파일에 쓰고 스토리지에 업로드
+    디코딩된 전체 바이트를 메모리에 한 번에 올리지 않음 (S3 업로드는 boto가 multipart로 스트리밍)
+    같은 임시 파일로 WebP 파생 이미지까지 만들어 (원본 경로, {"thumb": 경로, ...}) 반환
+    """
+    with tempfile.SpooledTemporaryFile(max_size=settings.IMAGE_INGEST_SPOOL_MAX_SIZE) as tmp:
+        _decode_b64_to_file(b64_data, tmp)
+        path = default_storage.save(name, File(tmp, name=name))
+        tmp.seek(0)
+        variants = build_image_variants(tmp, path)
+    return path, variants
+
+
+def build_image_variants(fileobj, source_name):
+    """
+    이미지 파일에서 크기별 WebP 파생 이미지를 만들어 스토리지에 저장
+    큰 크기부터 만들고 다음 크기는 직전 결과에서 줄여, 원본 비트맵은 첫 단계 이후 바로 해제
+    """
+    base_name = os.path.splitext(source_name)[0]
+    variants = {}
+
+    with _variant_slots:
+        image = Image.open(fileobj)
+        image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        for label, max_width in sorted(IMAGE_VARIANTS.items(), key=lambda item: -item[1]):
+            if image.width > max_width:
+                height = round(image.height * max_width / image.width)
+                image = image.resize((max_width, height), Image.LANCZOS)
+
+            variant_name = f"{base_name}_{label}.webp"
+            with tempfile.SpooledTemporaryFile(max_size=settings.IMAGE_INGEST_SPOOL_MAX_SIZE) as tmp:
+                image.save(tmp, format="WEBP", quality=settings.IMAGE_VARIANT_WEBP_QUALITY, method=4)
+                tmp.seek(0)
+                variants[label] = default_storage.save(variant_name, File(tmp, name=variant_name))
+        del image
+
+    return {label: variants[label] for label in IMAGE_VARIANTS}
+
+
+def build_cover_variants(story):
+    """
+    Story.cover가 바뀌었을 때만 파생 이미지를 다시 생성
+    """
+    if not story.cover:
+        return story.cover_variants
+    if story.cover_variants.get("source") == story.cover.name:
+        return story.cover_variants
+
+    with default_storage.open(story.cover.name, "rb") as f:
+        variants = build_image_variants(f, story.cover.name)
+    variants["source"] = story.cover.name
+    return variants
+
+
+def variant_urls(variants, signed_urls=None):
+    """
+    srcset 용도의 {라벨: URL} 맵
+    signed_urls: bulk_url()로 미리 서명해둔 {경로: URL} (없으면 개별 서명)
+    """
+    if not variants:
+        return {}
+    signed_urls = signed_urls or {}
+    return {
+        label: signed_urls.get(variants[label]) or default_storage.url(variants[label])
+        for label in IMAGE_VARIANTS
+        if variants.get(label)
+    }
+
+
+def illustration_file_names(illustrations):
+    """
+    원본 + 파생 이미지 경로 목록 (bulk 서명용)
+    """
+    names = []
+    for illustration in illustrations:
+        if illustration.image:
+            names.append(illustration.image.name)
+        names.extend(illustration.variants.get(label) for label in IMAGE_VARIANTS)
+    return [n for n in names if n]
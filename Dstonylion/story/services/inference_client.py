@@ -0,0 +1,69 @@
+import os, json, socket, tempfile
+from django.conf import settings
+
+
+class InferenceError(RuntimeError):
+    pass
+
+
+class InferenceClient:
+    """
+    로컬 추론 서버(runinferenceserver)에 합성/변환을 요청하는 클라이언트
+    결과 음성은 서버가 output_path에 직접 기록 (같은 호스트, INFERENCE_SCRATCH_DIR 아래만 허용)
+    """
+
+    def __init__(self, socket_path, timeout=None):
+        self.socket_path = socket_path
+        self.timeout = timeout if timeout is not None else settings.INFERENCE_SERVER_TIMEOUT
+
+    def _call(self, payload):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+
+        if not line:
+            raise InferenceError("추론 서버 응답이 없습니다.")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise InferenceError(response.get("error", "추론 실패"))
+        return response["output_path"]
+
+    def tts(self, language, text, output_path, speed=1.0):
+        return self._call({
+            "op": "tts",
+            "language": language,
+            "text": text,
+            "speed": speed,
+            "output_path": output_path,
+        })
+
+    def convert(self, source_audio_path, source_se_path, target_voice_id, output_path):
+        return self._call({
+            "op": "convert",
+            "source_audio_path": source_audio_path,
+            "source_se_path": source_se_path,
+            "target_voice_id": target_voice_id,
+            "output_path": output_path,
+        })
+
+
+def get_inference_client():
+    """
+    INFERENCE_SERVER_SOCKET이 설정되어 있으면 클라이언트, 아니면 None (프로세스 내 추론)
+    """
+    if not settings.INFERENCE_SERVER_SOCKET:
+        return None
+    return InferenceClient(settings.INFERENCE_SERVER_SOCKET)
+
+
+def inference_temp_dir():
+    """
+    합성용 임시 디렉터리. 추론 서버를 쓰면 서버가 허용하는 INFERENCE_SCRATCH_DIR 아래에 생성
+    """
+    if not settings.INFERENCE_SERVER_SOCKET:
+        return tempfile.TemporaryDirectory()
+    os.makedirs(settings.INFERENCE_SCRATCH_DIR, mode=0o700, exist_ok=True)
+    return tempfile.TemporaryDirectory(dir=settings.INFERENCE_SCRATCH_DIR)
@@ -0,0 +1,215 @@
+import os, json, asyncio, time, traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections
+
+from story.services import openvoice_service
+
+
+class InferenceServer:
+    """
+    OpenVoice/MeloTTS 모델을 소유하는 로컬 추론 서버
+    웹 워커들의 요청을 큐에 모아 호환되는 요청끼리 micro-batch로 처리
+
+    프로토콜: Unix 소켓, 요청/응답 모두 한 줄 JSON
+      {"op": "tts", "language": "KR", "text": "...", "speed": 1.0, "output_path": "..."}
+      {"op": "convert", "source_audio_path": "...", "source_se_path": "...", "target_voice_id": 1, "output_path": "..."}
+      → {"ok": true, "output_path": "..."} / {"ok": false, "error": "..."}
+
+    소켓은 서버 실행 계정만 접근 가능(0600)하고,
+    읽고 쓰는 음성 경로는 scratch_dir 아래로, 기본 화자 SE는 checkpoints_v2 아래로 제한
+    """
+
+    def __init__(self, socket_path, max_batch_size, max_batch_wait_ms, scratch_dir):
+        self.socket_path = socket_path
+        self.scratch_dir = os.path.realpath(scratch_dir)
+        self.checkpoint_dir = os.path.realpath(os.path.join(openvoice_service.BASE_DIR, "checkpoints_v2"))
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait_ms / 1000
+        self.queue = None
+        # 모델은 한 스레드에서만 돌려 배치가 서로 CPU를 뺏지 않도록 함
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+    async def serve(self):
+        self.queue = asyncio.Queue()
+        os.makedirs(self.scratch_dir, mode=0o700, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        # 소켓 파일이 생기기 전 잠깐 동안도 다른 계정이 접근하지 못하도록 umask로 생성 후 0600 고정
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+        batcher = asyncio.create_task(self.batch_loop())
+        print(f"Inference server listening on {self.socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    self.validate(request)
+                    future = asyncio.get_running_loop().create_future()
+                    await self.queue.put((request, future))
+                    response = {"ok": True, "output_path": await future}
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _is_within(path, directory):
+        real = os.path.realpath(path)
+        return os.path.commonpath([real, directory]) == directory
+
+    def validate(self, request):
+        """
+        허용되지 않은 op나 허용 디렉터리 밖의 경로가 있으면 ValueError
+        (경로를 그대로 열고 쓰므로 임의 파일 덮어쓰기/읽기 방지)
+        """
+        op = request.get("op")
+        if op not in ("tts", "convert"):
+            raise ValueError(f"알 수 없는 op: {op}")
+
+        paths = ["output_path"] + (["source_audio_path"] if op == "convert" else [])
+        for field in paths:
+            path = request.get(field)
+            if not isinstance(path, str) or not self._is_within(path, self.scratch_dir):
+                raise ValueError(f"{field}는 {self.scratch_dir} 아래 경로여야 합니다.")
+
+        if op == "convert":
+            se_path = request.get("source_se_path")
+            if not isinstance(se_path, str) or not self._is_within(se_path, self.checkpoint_dir):
+                raise ValueError(f"source_se_path는 {self.checkpoint_dir} 아래 경로여야 합니다.")
+
+    async def batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = time.monotonic() + self.max_batch_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            for items in self.group_compatible(batch).values():
+                requests = [request for request, _ in items]
+                try:
+                    results = await loop.run_in_executor(self.executor, self.run_batch, requests)
+                except Exception as e:
+                    results = [e] * len(items)
+                for (_, future), result in zip(items, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    @staticmethod
+    def group_compatible(batch):
+        # 같은 모델/속도로 한 번에 돌릴 수 있는 요청끼리 묶음
+        groups = defaultdict(list)
+        for request, future in batch:
+            if request["op"] == "tts":
+                key = ("tts", request.get("language", "KR"), float(request.get("speed", 1.0)))
+            else:
+                key = ("convert",)
+            groups[key].append((request, future))
+        return groups
+
+    def run_batch(self, requests):
+        close_old_connections()
+        try:
+            if requests[0]["op"] == "tts":
+                return self.run_tts_batch(requests)
+            return self.run_convert_batch(requests)
+        finally:
+            close_old_connections()
+
+    def run_tts_batch(self, requests):
+        # 같은 언어/속도 요청들을 패딩 배치 한 번으로 합성
+        language = requests[0].get("language", "KR")
+        try:
+            return openvoice_service.generate_tts_batch_to_files(language, [
+                (r["text"], float(r.get("speed", 1.0)), r["output_path"]) for r in requests
+            ])
+        except Exception:
+            traceback.print_exc()
+            if len(requests) == 1:
+                raise
+
+        # 배치 실패 시 어떤 요청이 문제인지 가리기 위해 개별 합성
+        results = []
+        for request in requests:
+            try:
+                results.append(openvoice_service.generate_tts(
+                    language,
+                    request["text"],
+                    request["output_path"],
+                    speed=float(request.get("speed", 1.0)),
+                ))
+            except Exception as e:
+                traceback.print_exc()
+                results.append(e)
+        return results
+
+    def run_convert_batch(self, requests):
+        from accounts.models import ClonedVoice
+
+        voice_ids = {r["target_voice_id"] for r in requests}
+        voices = ClonedVoice.objects.in_bulk(voice_ids)
+
+        results = []
+        for request in requests:
+            try:
+                voice = voices.get(request["target_voice_id"])
+                if voice is None or not voice.se_file:
+                    raise ValueError(f"SE 파일이 없는 목소리입니다: {request['target_voice_id']}")
+                results.append(openvoice_service.convert_tone(
+                    request["source_audio_path"],
+                    openvoice_service.get_base_speaker_se(request["source_se_path"]),
+                    openvoice_service.get_voice_se(voice),
+                    request["output_path"],
+                ))
+            except Exception as e:
+                traceback.print_exc()
+                results.append(e)
+        return results
+
+
+def run_server(socket_path=None, preload_languages=()):
+    openvoice_service.ensure_inference_allowed()
+    for language in preload_languages:
+        openvoice_service.get_tts_model(language)
+    if preload_languages:
+        openvoice_service.get_tone_color_converter()
+
+    server = InferenceServer(
+        socket_path or settings.INFERENCE_SERVER_SOCKET,
+        settings.INFERENCE_MAX_BATCH_SIZE,
+        settings.INFERENCE_MAX_BATCH_WAIT_MS,
+        settings.INFERENCE_SCRATCH_DIR,
+    )
+    asyncio.run(server.serve())
@@ -0,0 +1,129 @@
+import codecs
+from itertools import islice
+import chardet
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from story.models import Story, StoryPage, MoralTheme
+
+# 페이지 bulk insert 한 번에 넣을 최대 행 수
+PAGE_BATCH_SIZE = 500
+# 인코딩 판별에 쓸 앞부분 길이 (파일 전체를 chardet에 넣지 않음)
+ENCODING_SAMPLE_SIZE = 64 * 1024
+# 원본 바이트를 한 번에 읽어 디코딩할 크기
+DECODE_CHUNK_SIZE = 256 * 1024
+
+
+def iter_decoded(fileobj, sample_size=ENCODING_SAMPLE_SIZE, chunk_size=DECODE_CHUNK_SIZE):
+    """
+    바이너리 스트림(S3 body, storage 파일)을 앞부분 샘플로 인코딩을 판별한 뒤 chunk 단위로 디코딩해 yield
+    원본 바이트 전체를 메모리에 올리지 않음 (chunk 경계에서 잘린 멀티바이트 문자는 다음 chunk와 이어서 디코딩)
+    """
+    sample = fileobj.read(sample_size)
+    encoding = chardet.detect(sample).get("encoding") or "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+    yield decoder.decode(sample)
+    for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def read_text(fileobj, sample_size=ENCODING_SAMPLE_SIZE):
+    """
+    iter_decoded로 읽은 전체 본문 (Story.content 저장용)
+    """
+    return "".join(iter_decoded(fileobj, sample_size))
+
+
+def resolve_custom_morals(names):
+    """
+    사용자 입력 교훈 키워드를 MoralTheme으로 변환 (없는 것만 한 번에 생성)
+    키워드 수와 관계없이 쿼리 3번
+    """
+    names = list(dict.fromkeys(n.strip() for n in names if n and n.strip()))
+    if not names:
+        return []
+
+    keys = {name: f"custom_{name}" for name in names}
+    existing = {t.name: t for t in MoralTheme.objects.filter(name__in=names)}
+    missing = [name for name in names if name not in existing]
+    if missing:
+        MoralTheme.objects.bulk_create(
+            [MoralTheme(name=name, key=keys[name]) for name in missing],
+            ignore_conflicts=True,
+        )
+        created = MoralTheme.objects.filter(Q(name__in=missing) | Q(key__in=[keys[n] for n in missing]))
+        by_key = {t.key: t for t in created}
+        by_name = {t.name: t for t in created}
+        for name in missing:
+            theme = by_name.get(name) or by_key.get(keys[name])
+            if theme:
+                existing[name] = theme
+
+    return [existing[name] for name in names if name in existing]
+
+
+def bulk_create_pages(story, pages):
+    """
+    페이지 텍스트 iterable을 PAGE_BATCH_SIZE개씩 끊어 bulk insert, 생성한 페이지 수 반환
+    generator(iter_pages)를 넘기면 메모리에는 한 batch만 올라감
+    """
+    pages = iter(pages)
+    count = 0
+    while True:
+        batch = [
+            StoryPage(story=story, page_number=count + i, text=text)
+            for i, text in enumerate(islice(pages, PAGE_BATCH_SIZE), start=1)
+        ]
+        if not batch:
+            return count
+        StoryPage.objects.bulk_create(batch)
+        count += len(batch)
+
+
+def ingest_story(pages, moral_themes=(), custom_morals=(), **story_fields):
+    """
+    동화 + 전체 페이지 + 교훈 연결을 한 트랜잭션에서 생성
+    pages: 페이지 텍스트 목록 또는 generator (1페이지부터 순서대로)
+    페이지 수와 관계없이 쿼리 수가 일정 (페이지는 PAGE_BATCH_SIZE 단위 bulk insert)
+    """
+    with transaction.atomic():
+        sized = isinstance(pages, (list, tuple))
+        story = Story.objects.create(page_count=len(pages) if sized else 0, **story_fields)
+
+        page_count = bulk_create_pages(story, pages)
+        if not sized:
+            # generator는 다 넣은 뒤에야 페이지 수를 알 수 있음
+            Story.objects.filter(pk=story.pk).update(page_count=page_count)
+            story.page_count = page_count
+
+        themes = {t.id: t for t in list(moral_themes) + resolve_custom_morals(custom_morals)}
+        if themes:
+            Through = Story.morals.through
+            Through.objects.bulk_create(
+                [Through(story_id=story.id, moraltheme_id=theme_id) for theme_id in themes],
+                ignore_conflicts=True,
+            )
+
+    return story
+
+
+def replace_story_pages(story, pages, **story_fields):
+    """
+    기존 동화의 본문이 바뀐 경우 필드를 갱신하고 페이지를 다시 생성 (한 트랜잭션)
+    """
+    with transaction.atomic():
+        story.pages.all().delete()
+        story.page_count = bulk_create_pages(story, pages)
+
+        for field, value in story_fields.items():
+            setattr(story, field, value)
+        story.updated_at = timezone.now()
+        story.save()
+
+    return story
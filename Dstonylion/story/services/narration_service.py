@@ -0,0 +1,245 @@
+import os, hashlib, traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from story.models import NarrationJob, NarrationAudio
+from story.services.inference_client import get_inference_client, inference_temp_dir
+from story.services.audio_codec import encode_audio, store_encoded_audio
+
+NARRATION_LANGUAGE = "KR"
+BASE_SPEAKER_SE = os.path.join(settings.BASE_DIR.parent, "checkpoints_v2/base_speakers/ses/kr.pth")
+
+# 동화 단위 낭독 작업 풀
+_job_executor = ThreadPoolExecutor(
+    max_workers=settings.NARRATION_JOB_WORKERS,
+    thread_name_prefix="narration-job",
+)
+# 페이지 단위 합성 풀 (동시에 합성하는 페이지 수 = CPU 예산)
+_page_executor = ThreadPoolExecutor(
+    max_workers=settings.NARRATION_CPU_BUDGET,
+    thread_name_prefix="narration-page",
+)
+
+
+def page_text_hash(text):
+    return hashlib.sha256(text.strip().encode("utf-8")).hexdigest()
+
+
+def find_cached_audio(text_hash, voice_id, speed):
+    return (
+        NarrationAudio.objects
+        .filter(text_hash=text_hash, voice_id=voice_id, speed=speed)
+        .order_by("-created_at")
+        .first()
+    )
+
+
+def enqueue_narration_job(job_id):
+    """
+    낭독 작업을 백그라운드 풀에 등록 (트랜잭션 커밋 이후 실행)
+    """
+    transaction.on_commit(lambda: _job_executor.submit(run_narration_job, job_id))
+
+
+def render_audio(text, voice, speed, tmp_dir, base_path=None):
+    """
+    텍스트를 기본 화자로 합성하고 목소리가 있으면 음색 변환까지 한 wav 경로 반환
+    base_path가 주어지면 기본 화자 음성은 이미 (배치로) 합성된 상태
+    """
+    client = get_inference_client()
+
+    synthesized = base_path is not None
+    base_path = base_path or os.path.join(tmp_dir, "base.wav")
+    output_path = base_path
+    convert = bool(voice and voice.se_file)
+    if convert:
+        output_path = os.path.join(tmp_dir, "converted.wav")
+
+    if client:
+        # 추론 서버가 있으면 모델 작업은 서버에 위임
+        if not synthesized:
+            client.tts(NARRATION_LANGUAGE, text, base_path, speed=speed)
+        if convert:
+            client.convert(base_path, BASE_SPEAKER_SE, voice.id, output_path)
+    else:
+        # 무거운 모델 모듈은 실제 합성하는 워커에서만 import
+        from story.services.openvoice_service import (
+            generate_tts, convert_tone, get_base_speaker_se, get_voice_se,
+        )
+        if not synthesized:
+            generate_tts(NARRATION_LANGUAGE, text, base_path, speed=speed)
+        if convert:
+            convert_tone(base_path, get_base_speaker_se(BASE_SPEAKER_SE), get_voice_se(voice), output_path)
+
+    return output_path
+
+
+def synthesize_sentence(text, voice, speed):
+    """
+    스트리밍 낭독용: 한 문장을 합성/변환/인코딩해 (bytes, meta) 반환 (저장하지 않음)
+    """
+    close_old_connections()
+    try:
+        with inference_temp_dir() as tmp_dir:
+            output_path = render_audio(text, voice, speed, tmp_dir)
+            return encode_audio(output_path)
+    finally:
+        close_old_connections()
+
+
+def _synthesize(story_id, page, voice, speed, text_hash, base_path=None):
+    with inference_temp_dir() as tmp_dir:
+        output_path = render_audio(page.text, voice, speed, tmp_dir, base_path)
+
+        s3_path, audio_meta = store_encoded_audio(
+            output_path, f"narrations/{story_id}/p{page.page_number}_{text_hash[:12]}"
+        )
+
+    return NarrationAudio.objects.create(
+        text_hash=text_hash,
+        voice=voice,
+        speed=speed,
+        audio=s3_path,
+        audio_meta=audio_meta,
+    )
+
+
+def synthesize_base_audio(pages, voice, speed, tmp_dir):
+    """
+    캐시에 없는 페이지들의 기본 화자 음성을 패딩 배치로 한 번에 합성
+    {page.id: wav 경로} 반환
+    """
+    from story.services.openvoice_service import generate_tts_batch_to_files
+
+    hashes = {page.id: page_text_hash(page.text) for page in pages}
+    cached_hashes = set(
+        NarrationAudio.objects
+        .filter(text_hash__in=set(hashes.values()), voice=voice, speed=speed)
+        .values_list("text_hash", flat=True)
+    )
+    missing = [page for page in pages if hashes[page.id] not in cached_hashes]
+    if not missing:
+        return {}
+
+    base_paths = {page.id: os.path.join(tmp_dir, f"base_{page.id}.wav") for page in missing}
+    generate_tts_batch_to_files(NARRATION_LANGUAGE, [
+        (page.text, speed, base_paths[page.id]) for page in missing
+    ])
+    return base_paths
+
+
+def synthesize_page(job_id, story_id, page, voice, speed, base_path=None):
+    """
+    한 페이지를 기본 화자로 합성하고 동화 목소리로 변환해 저장
+    같은 (텍스트, 목소리, 속도)의 음성이 이미 있으면 재사용
+    """
+    close_old_connections()
+    try:
+        text_hash = page_text_hash(page.text)
+        audio = find_cached_audio(text_hash, voice.id if voice else None, speed)
+        if audio is None:
+            audio = _synthesize(story_id, page, voice, speed, text_hash, base_path)
+
+        NarrationJob.objects.filter(id=job_id).update(completed_pages=F("completed_pages") + 1)
+        return audio
+    finally:
+        close_old_connections()
+
+
+def run_narration_job(job_id):
+    close_old_connections()
+    try:
+        job = NarrationJob.objects.select_related("story", "voice").get(id=job_id)
+        pages = list(job.story.pages.all().order_by("page_number"))
+
+        job.status = "RUNNING"
+        job.total_pages = len(pages)
+        job.completed_pages = 0
+        job.started_at = timezone.now()
+        job.save(update_fields=["status", "total_pages", "completed_pages", "started_at"])
+
+        errors = []
+        with inference_temp_dir() as tmp_dir:
+            # 프로세스 내 추론이면 기본 화자 음성은 배치 한 번으로 합성하고 변환/업로드만 페이지별로 병렬 처리
+            # (추론 서버를 쓰면 서버가 여러 요청을 모아 배치 처리)
+            base_paths = {}
+            if get_inference_client() is None:
+                base_paths = synthesize_base_audio(pages, job.voice, job.speed, tmp_dir)
+
+            futures = [
+                _page_executor.submit(
+                    synthesize_page, job_id, job.story_id, page, job.voice, job.speed, base_paths.get(page.id)
+                )
+                for page in pages
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    traceback.print_exc()
+                    errors.append(str(e))
+
+        NarrationJob.objects.filter(id=job_id).update(
+            status="FAILED" if errors else "SUCCESS",
+            error_message="\n".join(errors),
+            finished_at=timezone.now(),
+        )
+
+    except Exception as e:
+        traceback.print_exc()
+        NarrationJob.objects.filter(id=job_id).update(
+            status="FAILED",
+            error_message=str(e),
+            finished_at=timezone.now(),
+        )
+    finally:
+        close_old_connections()
+
+
+def invalidate_voice_narrations(voice_id):
+    """
+    목소리를 다시 클로닝하면 SE가 바뀌므로 그 목소리로 합성해 둔 낭독 캐시를 모두 삭제
+    (파일 삭제 실패는 로그만 남김, 캐시 행은 항상 삭제)
+    """
+    audios = list(NarrationAudio.objects.filter(voice_id=voice_id))
+    NarrationAudio.objects.filter(id__in=[a.id for a in audios]).delete()
+
+    for audio in audios:
+        for name in (audio.audio.name, audio.audio_meta.get("source")):
+            if not name:
+                continue
+            try:
+                default_storage.delete(name)
+            except Exception as e:
+                print(f"낭독 캐시 파일 삭제 실패 ({name}):", e)
+    return len(audios)
+
+
+def page_narrations(pages, voice_id, speed):
+    """
+    페이지별 낭독 음성 URL 목록 (아직 합성되지 않은 페이지는 None)
+    """
+    hashes = {page.id: page_text_hash(page.text) for page in pages}
+    audios = {}
+    for audio in (
+        NarrationAudio.objects
+        .filter(text_hash__in=set(hashes.values()), voice_id=voice_id, speed=speed)
+        .order_by("created_at")
+    ):
+        audios[audio.text_hash] = audio
+
+    signed_urls = default_storage.bulk_url([a.audio.name for a in audios.values()])
+    result = []
+    for page in pages:
+        audio = audios.get(hashes[page.id])
+        result.append({
+            "page_number": page.page_number,
+            "audio_url": signed_urls.get(audio.audio.name) if audio else None,
+            "duration": audio.audio_meta.get("duration") if audio else None,
+        })
+    return result
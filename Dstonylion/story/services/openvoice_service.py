@@ -1,31 +1,126 @@
 import os
-import torch
-from melo.api import TTS
-from openvoice import se_extractor
-from openvoice.api import ToneColorConverter
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from django.conf import settings
+from django.core.files.storage import default_storage
 
-
-device = "cuda:0" if torch.cuda.is_available() else "cpu"
+# torch / melo / openvoice는 무거우므로 처음 실제로 쓰는 시점에 import
+# (로그인, 서재만 처리하는 워커는 모델 메모리와 로딩 시간을 부담하지 않음)
 
 # Dstonylion 기준이 아니라 Backend 기준으로 BASE_DIR 지정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 _ckpt_converter = os.path.join(BASE_DIR, "checkpoints_v2", "converter")
 
-print("Converter path:", _ckpt_converter)
 
-tone_color_converter = ToneColorConverter(
-    os.path.join(_ckpt_converter, "config.json"),
-    device=device
-)
-tone_color_converter.load_ckpt(os.path.join(_ckpt_converter, "checkpoint.pth"))
+class InferenceDisabledError(RuntimeError):
+    pass
+
+
+def ensure_inference_allowed():
+    """
+    INFERENCE_MODELS_ENABLED=0 으로 띄운 프로세스에서는 모델 로드 자체를 막음
+    """
+    if not settings.INFERENCE_MODELS_ENABLED:
+        raise InferenceDisabledError("이 프로세스에서는 추론 모델을 로드할 수 없습니다. (INFERENCE_MODELS_ENABLED=0)")
+
+
+@lru_cache(maxsize=None)
+def get_device():
+    import torch
+    return "cuda:0" if torch.cuda.is_available() else "cpu"
+
+
+_tone_color_converter = None
+_converter_lock = threading.Lock()
+
+
+def get_tone_color_converter():
+    """
+    ToneColorConverter를 첫 사용 시점에 한 번만 생성
+    """
+    global _tone_color_converter
+    if _tone_color_converter is not None:
+        return _tone_color_converter
+
+    with _converter_lock:
+        if _tone_color_converter is None:
+            ensure_inference_allowed()
+            from openvoice.api import ToneColorConverter
+
+            print("Converter path:", _ckpt_converter)
+            converter = ToneColorConverter(
+                os.path.join(_ckpt_converter, "config.json"),
+                device=get_device()
+            )
+            converter.load_ckpt(os.path.join(_ckpt_converter, "checkpoint.pth"))
+            _tone_color_converter = converter
+    return _tone_color_converter
+
+
+# 언어별 MeloTTS 모델 레지스트리 (프로세스 단위, LRU)
+_tts_models = OrderedDict()
+_tts_lock = threading.Lock()
+_tts_stats = {"loads": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+
+def _available_memory_mb():
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None  # 지원하지 않는 플랫폼
+
+
+def _evict_tts_model():
+    language, _ = _tts_models.popitem(last=False)
+    _tts_stats["evictions"] += 1
+    print("TTS 모델 해제:", language)
+
+
+def get_tts_model(language: str):
+    """
+    언어별 TTS 모델을 한 번만 로드해 재사용
+    캐시 개수(TTS_MODEL_CACHE_SIZE)를 넘거나 여유 메모리가 부족하면 오래 안 쓴 모델부터 해제
+    """
+    with _tts_lock:
+        model = _tts_models.get(language)
+        if model is not None:
+            _tts_models.move_to_end(language)
+            _tts_stats["hits"] += 1
+            return model
+
+        _tts_stats["misses"] += 1
+        ensure_inference_allowed()
+        from melo.api import TTS
+
+        min_free_mb = settings.TTS_MODEL_MIN_FREE_MB
+        while _tts_models and min_free_mb:
+            available = _available_memory_mb()
+            if available is None or available >= min_free_mb:
+                break
+            _evict_tts_model()
+
+        model = TTS(language=language, device=get_device())
+        _tts_stats["loads"] += 1
+        _tts_models[language] = model
+
+        while len(_tts_models) > settings.TTS_MODEL_CACHE_SIZE:
+            _evict_tts_model()
+
+        return model
+
+
+def tts_registry_stats():
+    with _tts_lock:
+        return {**_tts_stats, "loaded": list(_tts_models.keys())}
 
 
 def generate_tts(language: str, text: str, output_path: str, speed: float = 1.0):
     """
     텍스트를 지정한 언어의 기본 화자 목소리로 TTS 변환.
     """
-    device = "cuda:0" if torch.cuda.is_available() else "cpu"
-    model = TTS(language=language, device=device)
+    model = get_tts_model(language)
     speaker_ids = model.hps.data.spk2id
 
     # 기본 화자 선택 (첫 번째)
@@ -38,9 +133,158 @@ def generate_tts(language: str, text: str, output_path: str, speed: float = 1.0)
     return output_path
 
 
+def generate_tts_batch(language: str, items, sdp_ratio=0.2, noise_scale=0.6, noise_scale_w=0.8):
+    """
+    여러 (text, speaker_id, speed) 항목을 패딩 배치로 한 번에 합성
+    speaker_id가 None이면 기본 화자, 반환값은 항목별 오디오 배열 (np.float32) 목록
+    텍스트 전처리/문장 분할은 tts_to_file과 동일하고, 같은 speed의 문장 조각끼리 한 번의 forward로 추론
+    """
+    import torch
+    from melo import utils
+
+    model = get_tts_model(language)
+    hps = model.hps
+    device = get_device()
+    speaker_ids = hps.data.spk2id
+    default_speaker_id = speaker_ids[list(speaker_ids.keys())[0]]
+
+    # 1. 항목을 문장 조각으로 나누고 speed별로 묶음
+    pieces_by_speed = defaultdict(list)  # speed → [(item_index, piece_index, speaker_id, features)]
+    piece_counts = []
+    for item_index, (text, speaker_id, speed) in enumerate(items):
+        pieces = model.split_sentences_into_pieces(text, language, quiet=True)
+        piece_counts.append(len(pieces))
+        for piece_index, piece in enumerate(pieces):
+            if language in ["EN", "ZH_MIX_EN"]:
+                piece = re.sub(r"([a-z])([A-Z])", r"\1 \2", piece)
+            features = utils.get_text_for_tts_infer(piece, language, hps, device, model.symbol_to_id)
+            speaker = default_speaker_id if speaker_id is None else speaker_id
+            pieces_by_speed[float(speed)].append((item_index, piece_index, speaker, features))
+
+    # 2. 길이순으로 정렬해 패딩 낭비를 줄이고 TTS_MAX_BATCH_SIZE 단위로 추론
+    piece_audio = {}
+    hop_length = hps.data.hop_length
+    for speed, pieces in pieces_by_speed.items():
+        pieces.sort(key=lambda p: p[3][2].size(0))
+        for start in range(0, len(pieces), settings.TTS_MAX_BATCH_SIZE):
+            chunk = pieces[start:start + settings.TTS_MAX_BATCH_SIZE]
+            lengths = [p[3][2].size(0) for p in chunk]
+            max_len = max(lengths)
+
+            def pad(index):
+                # 마지막 축(음소 길이)을 max_len까지 0으로 채워 배치로 쌓음
+                return torch.stack([
+                    torch.nn.functional.pad(p[3][index], (0, max_len - p[3][index].size(-1)))
+                    for p in chunk
+                ]).to(device)
+
+            bert, ja_bert = pad(0), pad(1)
+            phones, tones, lang_ids = pad(2), pad(3), pad(4)
+            x_lengths = torch.LongTensor(lengths).to(device)
+            speakers = torch.LongTensor([p[2] for p in chunk]).to(device)
+
+            with torch.no_grad():
+                audio, _, y_mask, _ = model.model.infer(
+                    phones,
+                    x_lengths,
+                    speakers,
+                    tones,
+                    lang_ids,
+                    bert,
+                    ja_bert,
+                    sdp_ratio=sdp_ratio,
+                    noise_scale=noise_scale,
+                    noise_scale_w=noise_scale_w,
+                    length_scale=1. / speed,
+                )
+            audio_lengths = (y_mask.sum(dim=(1, 2)) * hop_length).long().tolist()
+            for row, piece in enumerate(chunk):
+                piece_audio[(piece[0], piece[1])] = audio[row, 0, :audio_lengths[row]].data.cpu().float().numpy()
+            del bert, ja_bert, phones, tones, lang_ids, x_lengths, speakers, audio
+
+    # 3. 항목별로 조각을 이어붙임 (tts_to_file과 같은 간격)
+    results = []
+    for item_index, (_, _, speed) in enumerate(items):
+        segments = [piece_audio[(item_index, i)] for i in range(piece_counts[item_index])]
+        results.append(model.audio_numpy_concat(segments, sr=hps.data.sampling_rate, speed=speed))
+    return results
+
+
+def generate_tts_batch_to_files(language: str, items):
+    """
+    [(text, speed, output_path)] 를 배치 합성해 wav 파일로 저장
+    """
+    import soundfile
+
+    model = get_tts_model(language)
+    audios = generate_tts_batch(language, [(text, None, speed) for text, speed, _ in items])
+    for (_, _, output_path), audio in zip(items, audios):
+        soundfile.write(output_path, audio, model.hps.data.sampling_rate)
+    return [output_path for _, _, output_path in items]
+
+
+# 화자 임베딩(SE) 캐시: 기본 화자는 파일 경로, 클로닝 목소리는 (voice id, se_file 경로)로 구분
+_se_cache = OrderedDict()
+_se_lock = threading.Lock()
+
+
+def _se_cache_get(key):
+    with _se_lock:
+        se = _se_cache.get(key)
+        if se is not None:
+            _se_cache.move_to_end(key)
+        return se
+
+
+def _se_cache_put(key, se):
+    with _se_lock:
+        _se_cache[key] = se
+        _se_cache.move_to_end(key)
+        while len(_se_cache) > settings.SPEAKER_SE_CACHE_SIZE:
+            _se_cache.popitem(last=False)
+
+
+def get_base_speaker_se(se_path):
+    key = ("base", se_path)
+    se = _se_cache_get(key)
+    if se is None:
+        import torch
+        se = torch.load(se_path, map_location=get_device())
+        _se_cache_put(key, se)
+    return se
+
+
+def get_voice_se(voice):
+    """
+    ClonedVoice의 SE를 S3에서 한 번만 받아 재사용
+    se_file이 바뀌면 경로가 달라지므로 새로 로드하고 이전 항목은 버림
+    """
+    key = ("voice", voice.id, voice.se_file.name)
+    se = _se_cache_get(key)
+    if se is not None:
+        return se
+
+    import torch
+    with default_storage.open(voice.se_file.name, "rb") as f:
+        se = torch.load(f, map_location=get_device())
+
+    invalidate_voice_se(voice.id)
+    _se_cache_put(key, se)
+    return se
+
+
+def invalidate_voice_se(voice_id):
+    with _se_lock:
+        for key in [k for k in _se_cache if k[0] == "voice" and k[1] == voice_id]:
+            del _se_cache[key]
+
+
 def clone_voice(source_audio_path, reference_audio_path, base_speaker_se_path, output_path):
+    from openvoice import se_extractor
+
+    tone_color_converter = get_tone_color_converter()
     target_se, _ = se_extractor.get_se(reference_audio_path, tone_color_converter, vad=True)
-    source_se = torch.load(base_speaker_se_path, map_location=device)
+    source_se = get_base_speaker_se(base_speaker_se_path)
 
     tone_color_converter.convert(
         audio_src_path=source_audio_path,
@@ -49,5 +293,18 @@ def clone_voice(source_audio_path, reference_audio_path, base_speaker_se_path, o
         output_path=output_path,
         message="@MyShell"
     )
-    return output_path, target_se 
+    return output_path, target_se
+
 
+def convert_tone(source_audio_path, source_se, target_se, output_path):
+    """
+    기본 화자로 합성한 음성을 대상 목소리(SE)로 변환
+    """
+    get_tone_color_converter().convert(
+        audio_src_path=source_audio_path,
+        src_se=source_se,
+        tgt_se=target_se,
+        output_path=output_path,
+        message="@MyShell"
+    )
+    return output_path
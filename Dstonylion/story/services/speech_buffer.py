@@ -0,0 +1,78 @@
+import io
+import numpy as np
+from django.conf import settings
+
+SAMPLE_RATE = 16000
+
+
+def decode_chunk(chunk_bytes):
+    """
+    클라이언트가 보낸 음성 frame(wav/webm 등)을 16kHz mono float32 PCM으로 디코딩 (메모리에서만 처리)
+    """
+    from faster_whisper import decode_audio
+
+    return decode_audio(io.BytesIO(chunk_bytes), sampling_rate=SAMPLE_RATE)
+
+
+class SpeechBuffer:
+    """
+    연결마다 하나씩 두는 누적 음성 버퍼
+    silero VAD로 발화 구간만 남기고, 말하는 중에는 partial, 멈춤(무음)이 감지되면 final 구간을 돌려줌
+    작은 frame은 여기서 합쳐지므로 frame 경계에서 단어가 잘리지 않음
+    """
+
+    def __init__(self):
+        from faster_whisper.vad import VadOptions
+
+        self.audio = np.zeros(0, dtype=np.float32)
+        self.vad_options = VadOptions(
+            min_silence_duration_ms=settings.STT_VAD_MIN_SILENCE_MS,
+            speech_pad_ms=settings.STT_VAD_SPEECH_PAD_MS,
+        )
+        self.min_silence = settings.STT_VAD_MIN_SILENCE_MS * SAMPLE_RATE // 1000
+        self.partial_interval = int(settings.STT_PARTIAL_INTERVAL_S * SAMPLE_RATE)
+        self.max_segment = int(settings.STT_MAX_SEGMENT_S * SAMPLE_RATE)
+        # 발화가 없을 때 버퍼에 남겨둘 길이 (발화 시작 부분이 잘리지 않도록)
+        self.keep_tail = settings.STT_VAD_SPEECH_PAD_MS * SAMPLE_RATE // 1000
+        self.last_partial_at = 0
+
+    def feed(self, pcm):
+        """
+        PCM을 추가하고 [("partial" | "final", 구간 PCM)] 반환
+        """
+        from faster_whisper.vad import get_speech_timestamps
+
+        self.audio = np.concatenate([self.audio, pcm])
+        speech = get_speech_timestamps(self.audio, self.vad_options, sampling_rate=SAMPLE_RATE)
+
+        if not speech:
+            # 무음만 있으면 STT 호출 없이 꼬리만 남기고 버림
+            self.audio = self.audio[-self.keep_tail:] if self.keep_tail else self.audio[:0]
+            self.last_partial_at = 0
+            return []
+
+        start, end = speech[0]["start"], speech[-1]["end"]
+        trailing_silence = len(self.audio) - end
+
+        if trailing_silence >= self.min_silence or end - start >= self.max_segment:
+            segment = self.audio[start:end]
+            self.audio = self.audio[end:]
+            self.last_partial_at = 0
+            return [("final", segment)]
+
+        if end - start - self.last_partial_at >= self.partial_interval:
+            self.last_partial_at = end - start
+            return [("partial", self.audio[start:end])]
+        return []
+
+    def flush(self):
+        """
+        일시정지/종료 시 남은 발화를 final로 반환
+        """
+        from faster_whisper.vad import get_speech_timestamps
+
+        speech = get_speech_timestamps(self.audio, self.vad_options, sampling_rate=SAMPLE_RATE)
+        segment = self.audio[speech[0]["start"]:speech[-1]["end"]] if speech else None
+        self.audio = self.audio[:0]
+        self.last_partial_at = 0
+        return [("final", segment)] if segment is not None and len(segment) else []
@@ -0,0 +1,157 @@
+import io, os, wave, asyncio, threading, traceback
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from dotenv import load_dotenv
+from openai import OpenAI
+
+# faster-whisper(CTranslate2)는 무거우므로 첫 로컬 인식 시점에 import / 모델 로드
+# 모델은 프로세스당 하나만 두고 모든 WebSocket 연결이 공유
+
+load_dotenv(settings.BASE_DIR / ".env")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+client = OpenAI(api_key=OPENAI_API_KEY)
+
+STT_BACKENDS = ("local", "openai")
+
+# 프로세스 전체의 동시 인식 개수 상한 (final 전용)
+_stt_executor = ThreadPoolExecutor(
+    max_workers=settings.STT_NUM_WORKERS,
+    thread_name_prefix="stt",
+)
+# partial 전용 풀: final 앞에 partial이 줄 서지 않도록 분리하고, 꽉 차 있으면 partial은 버림
+_partial_executor = ThreadPoolExecutor(
+    max_workers=settings.STT_PARTIAL_WORKERS,
+    thread_name_prefix="stt-partial",
+)
+_partial_slots = threading.BoundedSemaphore(settings.STT_PARTIAL_WORKERS)
+
+_whisper_model = None
+_whisper_lock = threading.Lock()
+
+
+def get_whisper_model():
+    """
+    int8 양자화된 faster-whisper 모델을 첫 사용 시점에 한 번만 로드
+    """
+    global _whisper_model
+    if _whisper_model is not None:
+        return _whisper_model
+
+    with _whisper_lock:
+        if _whisper_model is None:
+            from faster_whisper import WhisperModel
+
+            print("Whisper model:", settings.STT_MODEL, settings.STT_COMPUTE_TYPE)
+            _whisper_model = WhisperModel(
+                settings.STT_MODEL,
+                device=settings.STT_DEVICE,
+                compute_type=settings.STT_COMPUTE_TYPE,
+                cpu_threads=settings.STT_CPU_THREADS,
+                # final + partial 풀 스레드가 모델 worker를 서로 기다리지 않도록 합산
+                num_workers=settings.STT_NUM_WORKERS + settings.STT_PARTIAL_WORKERS,
+            )
+    return _whisper_model
+
+
+def transcribe_local(audio, partial=False):
+    """
+    audio: 파일 경로 / file-like / 16kHz float32 numpy 배열
+    partial: 말하는 중 보여줄 임시 결과 (greedy, timestamp 없이 가볍게)
+    """
+    segments, _ = get_whisper_model().transcribe(
+        audio,
+        language=settings.STT_LANGUAGE,
+        beam_size=1 if partial else settings.STT_BEAM_SIZE,
+        without_timestamps=partial,
+        condition_on_previous_text=False,
+    )
+    return " ".join(segment.text.strip() for segment in segments).strip()
+
+
+def pcm_to_wav(samples, sample_rate=16000):
+    """
+    float32 numpy 배열을 API 업로드용 wav BytesIO로 변환
+    """
+    import numpy as np
+
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm.tobytes())
+    buffer.seek(0)
+    buffer.name = "audio.wav"
+    return buffer
+
+
+def transcribe_api(audio):
+    """
+    OpenAI whisper-1 API 인식 (audio: 파일 경로 / file-like / numpy 배열)
+    """
+    if isinstance(audio, str):
+        with open(audio, "rb") as f:
+            return transcribe_api(f)
+    if hasattr(audio, "dtype"):
+        audio = pcm_to_wav(audio)
+
+    result = client.audio.transcriptions.create(
+        model="whisper-1",
+        file=audio,
+        language=settings.STT_LANGUAGE,
+    )
+    return result.text.strip()
+
+
+def transcribe(audio, backend=None):
+    """
+    STT_BACKEND로 인식, 로컬 인식이 실패하면 STT_API_FALLBACK이 켜진 경우 API로 재시도
+    """
+    backend = backend or settings.STT_BACKEND
+    if backend not in STT_BACKENDS:
+        raise ValueError(f"지원하지 않는 STT_BACKEND: {backend}")
+
+    if backend == "openai":
+        return transcribe_api(audio)
+
+    try:
+        return transcribe_local(audio)
+    except Exception:
+        if not settings.STT_API_FALLBACK:
+            raise
+        traceback.print_exc()
+        print("로컬 STT 실패 → whisper-1 API로 재시도")
+        if hasattr(audio, "seek"):
+            audio.seek(0)
+        return transcribe_api(audio)
+
+
+def partials_enabled():
+    # partial은 호출 횟수가 많아 로컬 모델일 때만 사용 (API 비용/지연 방지)
+    return settings.STT_BACKEND == "local"
+
+
+async def transcribe_async(audio, backend=None):
+    """
+    이벤트 루프를 막지 않도록 STT 전용 스레드 풀에서 인식
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_stt_executor, transcribe, audio, backend)
+
+
+def _transcribe_partial(audio):
+    try:
+        return transcribe_local(audio, partial=True)
+    finally:
+        _partial_slots.release()
+
+
+async def transcribe_partial_async(audio):
+    """
+    partial 전용 풀에서 인식, 풀이 모두 사용 중이면 대기하지 않고 None (다음 partial이 최신 결과를 대신함)
+    """
+    if not _partial_slots.acquire(blocking=False):
+        return None
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_partial_executor, _transcribe_partial, audio)
@@ -0,0 +1,42 @@
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from django.db import close_old_connections, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Story
+from .services.image_service import build_cover_variants
+
+# 표지 파생 이미지 생성 풀 (저장 요청 스레드에서 S3 다운로드/리사이즈를 하지 않도록)
+_cover_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cover-variants")
+
+
+def run_cover_variants(story_id):
+    """
+    백그라운드에서 표지 파생 이미지 생성, 실패해도 로그만 남김 (다음 저장 때 다시 시도)
+    """
+    close_old_connections()
+    try:
+        story = Story.objects.filter(pk=story_id).first()
+        if not story or not story.cover:
+            return
+
+        variants = build_cover_variants(story)
+        # 그 사이 표지가 또 바뀌었으면 덮어쓰지 않음
+        # save() 대신 update()로 저장해 post_save 재귀 방지
+        Story.objects.filter(pk=story_id, cover=story.cover.name).update(cover_variants=variants)
+    except Exception as e:
+        print(f"[cover variants] story {story_id} 실패: {e}")
+        traceback.print_exc()
+    finally:
+        close_old_connections()
+
+
+@receiver(post_save, sender=Story)
+def create_cover_variants(sender, instance, **kwargs):
+    # 표지가 새로 올라온 경우에만 WebP 파생 이미지 생성 (커밋 이후 백그라운드 실행)
+    if not instance.cover or instance.cover_variants.get("source") == instance.cover.name:
+        return
+
+    story_id = instance.pk
+    transaction.on_commit(lambda: _cover_executor.submit(run_cover_variants, story_id))
@@ -1,3 +1,45 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from story.models import Story, MoralTheme
+from story.services.ingest_service import ingest_story
+
+
+class IngestStoryQueryCountTests(TestCase):
+    """
+    ingest_story의 쿼리 수는 페이지 수와 관계없이 일정해야 함
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="ingest", password="pw")
+        cls.theme = MoralTheme.objects.create(key="honesty", name="정직")
+
+    def ingest(self, n, custom_moral):
+        return ingest_story(
+            [f"{i}페이지 본문입니다." for i in range(1, n + 1)],
+            moral_themes=[self.theme],
+            custom_morals=[custom_moral],
+            user=self.user,
+            title=f"동화 {n}",
+            author="작가",
+            content="본문",
+        )
+
+    def test_query_count_is_constant_for_new_custom_moral(self):
+        # 새 교훈 키워드: 트랜잭션 + 동화 생성 + 페이지 insert + 교훈 조회/생성/재조회 + 교훈 연결
+        for n in (1, 10, 100):
+            with self.subTest(pages=n), self.assertNumQueries(8):
+                story = self.ingest(n, f"새 교훈 {n}")
+            self.assertEqual(story.page_count, n)
+            self.assertEqual(story.pages.count(), n)
+            self.assertEqual(story.morals.count(), 2)
+
+    def test_query_count_is_constant_for_existing_custom_moral(self):
+        # 이미 있는 교훈 키워드는 생성/재조회가 빠짐
+        self.ingest(1, "용기")
+        for n in (1, 10, 100):
+            with self.subTest(pages=n), self.assertNumQueries(6):
+                self.ingest(n, "용기")
+        self.assertEqual(MoralTheme.objects.filter(name="용기").count(), 1)
+        self.assertEqual(Story.objects.filter(morals__name="용기").count(), 4)
@@ -17,5 +17,7 @@ urlpatterns = [
     path('classic/upload/', ClassicStoryUploadView.as_view()),
     path('<int:story_id>/', StoryDetailView.as_view()),
     path('<int:story_id>/pages/', StoryPageListView.as_view()),
-    path('<int:story_id>/script/', StoryScriptView.as_view())
+    path('<int:story_id>/script/', StoryScriptView.as_view()),
+    path('<int:story_id>/narration/', NarrationGenerateView.as_view()),
+    path('narration/jobs/<int:pk>/', NarrationJobDetailView.as_view()),
 ]
\ No newline at end of file
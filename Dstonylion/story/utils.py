@@ -1,26 +1,67 @@
 #생성된 동화를 페이지별로 나누는 공통 로직
 import re
 
-def split_into_pages(text: str, sentences_per_page: int = 3):
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# 스트림에서 한 번에 읽을 문자 수
+READ_CHUNK_SIZE = 64 * 1024
+
+def iter_sentences(source, chunk_size: int = READ_CHUNK_SIZE):
+    """
+    문자열 또는 텍스트 스트림(read() 지원)에서 문장을 하나씩 yield
+    둘 다 chunk 단위로 나눠 split하고, 마지막 문장 경계 뒤의 미완성 문장만 다음 chunk로 넘김
+    (문자열도 전체를 한 번에 split하지 않으므로 긴 책에서 문장 목록 전체가 메모리에 올라가지 않음)
+    """
+    if isinstance(source, str):
+        chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    else:
+        chunks = iter(lambda: source.read(chunk_size), "")
+
+    carry = ""
+    for chunk in chunks:
+        parts = SENTENCE_SPLIT_RE.split(carry + chunk)
+        carry = parts.pop()
+        for s in parts:
+            if s.strip():
+                yield s.strip()
+
+    if carry.strip():
+        yield carry.strip()
+
+def split_into_sentences(text: str):
     if not text:
         return []
 
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    return list(iter_sentences(text))
+
+def iter_pages(source, sentences_per_page: int = 3, max_chars: int = None):
+    """
+    문장 sentences_per_page개(또는 max_chars 글자 예산)마다 한 페이지씩 yield
+    전체 문장/페이지 목록을 만들지 않으므로 긴 명작동화도 메모리를 일정하게 사용
+    """
+    if not source:
+        return
 
-    pages = []
     buffer = []
+    length = 0
 
-    for s in sentences:
-        if not s:
-            continue
+    for s in iter_sentences(source):
+        # 글자 예산을 넘기게 되면 현재까지를 한 페이지로 마감 (문장 하나가 예산보다 길면 단독 페이지)
+        if max_chars and buffer and length + 1 + len(s) > max_chars:
+            yield " ".join(buffer)
+            buffer, length = [], 0
 
-        buffer.append(s.strip())
+        buffer.append(s)
+        length += len(s) + (1 if length else 0)
 
         if len(buffer) == sentences_per_page:
-            pages.append(" ".join(buffer))
-            buffer = []
+            yield " ".join(buffer)
+            buffer, length = [], 0
 
     if buffer:
-        pages.append(" ".join(buffer))
+        yield " ".join(buffer)
+
+def split_into_pages(text: str, sentences_per_page: int = 3):
+    if not text:
+        return []
 
-    return pages
+    return list(iter_pages(text, sentences_per_page))
@@ -1,4 +1,4 @@
-import redis, random, os, json, re
+import random, os, json, re
 import openai
 from django.conf import settings
 from django.shortcuts import render
@@ -12,7 +12,12 @@ from django.core.files.storage import default_storage
 from rest_framework import viewsets, status
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
-from story.utils import split_into_pages
+from story.utils import split_into_pages, iter_pages
+from story.redis_client import StorySessionStore
+from story.pagination import KeysetPagination, InvalidCursor
+from story.services.ingest_service import ingest_story, read_text
+from story.services.image_service import illustration_file_names
+from story.services.narration_service import enqueue_narration_job, page_narrations
 from dotenv import load_dotenv
 from django.utils.text import slugify
 
@@ -42,13 +47,7 @@ class StoryOptionSaveView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        redis_client = redis.StrictRedis(
-            host=getattr(settings, "REDIS_HOST", "localhost"),
-            port=getattr(settings, "REDIS_PORT", 6379),
-            db=0,
-            decode_responses=True,
-        )
-        redis_client.hmset(f"story_option:{request.user.id}", {"runtime": runtime, "age_group": age_group})
+        StorySessionStore(request.user.id).save_option(runtime, age_group)
 
         return Response({"next": "/story/record/"}, status=status.HTTP_200_OK)
     
@@ -68,18 +67,8 @@ class StoryDraftUpdateView(APIView):
                 status=400
             )
 
-        # Redis 연결
-        redis_client = redis.StrictRedis(
-            host=getattr(settings, "REDIS_HOST", "localhost"),
-            port=getattr(settings, "REDIS_PORT", 6379),
-            db=0,
-            decode_responses=True,
-        )
-
-        redis_key = f"story_draft:{request.user.id}"
-
         # 최종 텍스트 저장
-        redis_client.set(redis_key, text)
+        StorySessionStore(request.user.id).save_draft(text)
 
         return Response(
             {"message": "draft 업데이트 완료되었습니다."},
@@ -222,19 +211,7 @@ class StoryMoralSaveView(APIView):
             created_custom_ids.append(obj.id)
 
         # Redis 저장
-        redis_client = redis.StrictRedis(
-            host=getattr(settings, "REDIS_HOST", "localhost"),
-            port=getattr(settings, "REDIS_PORT", 6379),
-            db=0,
-            decode_responses=True,
-        )
-        user_id = request.user.id
-        redis_key = f"story_morals:{user_id}"
-
-        redis_client.hset(redis_key, mapping={
-            "selected_ids": ",".join(map(str, selected_ids)),
-            "custom_morals": ",".join(custom_morals)
-        })
+        StorySessionStore(request.user.id).save_morals(selected_ids, custom_morals)
 
         return Response({
             "message": "교훈이 저장되었습니다.",
@@ -264,17 +241,11 @@ class StoryGenerateView(APIView):
     def post(self, request):
         ensure_default_morals()
 
-        redis_client = redis.StrictRedis(
-            host=getattr(settings, "REDIS_HOST", "localhost"),
-            port=getattr(settings, "REDIS_PORT", 6379),
-            db=0,
-            decode_responses=True,
-        )
-
-        user_id = request.user.id
-        option = redis_client.hgetall(f"story_option:{user_id}")
-        draft = redis_client.get(f"story_draft:{user_id}")
-        moral_data = redis_client.hgetall(f"story_morals:{user_id}")
+        # 옵션/draft/교훈을 한 번의 왕복으로 조회
+        session = StorySessionStore(request.user.id).load()
+        option = session["option"]
+        draft = session["draft"]
+        moral_data = session["morals"]
 
         if not option or not moral_data:
             return Response({"error": "필요한 데이터가 모두 준비되지 않았습니다."}, status=400)
@@ -335,7 +306,11 @@ class StoryGenerateView(APIView):
         except Exception as e:
             return Response({"error": f"AI 생성 오류: {str(e)}"}, status=500)
 
-        story = Story.objects.create(
+        # 동화, 페이지, 교훈 연결을 한 트랜잭션에서 생성
+        story = ingest_story(
+            split_into_pages(body),
+            moral_themes=themes,
+            custom_morals=custom_morals,
             user=request.user,
             title=title,
             author=request.user.username,
@@ -345,25 +320,6 @@ class StoryGenerateView(APIView):
             age_group=age_group,
         )
 
-        for theme in themes:
-            story.morals.add(theme)
-
-        for kw in custom_morals:
-            custom_theme, _ = MoralTheme.objects.get_or_create(name=kw, defaults={"key": f"custom_{kw}"})
-            story.morals.add(custom_theme)
-
-        pages = split_into_pages(body)
-
-        for id, page_text in enumerate(pages, start=1):
-            StoryPage.objects.create(
-                story=story,
-                page_number=id,
-                text=page_text
-            )
-        
-        story.page_count = len(pages)
-        story.save()
-
         serializer = StorySerializer(story)
         return Response(serializer.data, status=201)
     
@@ -374,21 +330,7 @@ class StoryResetView(APIView):
         user_id = request.user.id
         
         try:
-            redis_client = redis.StrictRedis(
-                host=getattr(settings, "REDIS_HOST", "localhost"),
-                port=getattr(settings, "REDIS_PORT", 6379),
-                db=0,
-                decode_responses=True,
-            )
-
-            keys = [
-                f"story_option:{user_id}",
-                f"story_draft:{user_id}",
-                f"story_morals:{user_id}",
-            ]
-
-            for key in keys:
-                redis_client.delete(key)
+            StorySessionStore(user_id).clear()
 
         except Exception:
             return Response({"error": "Redis 연결에 실패했습니다."}, status=400)
@@ -521,11 +463,15 @@ class StoryListView(APIView):
         if category in ["classic", "custom", "extended"]:
             stories = stories.filter(category=category)
         
-        stories = stories.order_by("-created_at")
-        
+        # 최신순 cursor 페이지네이션 ((created_at, id) 복합 인덱스 사용)
+        try:
+            stories, next_cursor = KeysetPagination("created_at").paginate(stories, request)
+        except InvalidCursor as e:
+            return Response({"error": str(e)}, status=400)
+
         serializer = StoryInfoSerializer(stories, many=True)
 
-        return Response(serializer.data, status=200)
+        return Response({"results": serializer.data, "next_cursor": next_cursor}, status=200)
     
 class StoryDetailView(APIView):
     def get(self, request, story_id):
@@ -551,8 +497,13 @@ class StoryPageListView(APIView):
             lib.last_viewed_time = timezone.now()
             lib.save()
 
-        pages = StoryPage.objects.filter(story=story).order_by("page_number")
-        serializer = StoryPageSerializer(pages, many=True)
+        pages = StoryPage.objects.filter(story=story).order_by("page_number").prefetch_related("illustrations")
+
+        # 페이지 전체 삽화 URL을 한 번에 서명
+        illustrations = [i for page in pages for i in page.illustrations.all()]
+        signed_urls = default_storage.bulk_url(illustration_file_names(illustrations))
+
+        serializer = StoryPageSerializer(pages, many=True, context={"signed_urls": signed_urls})
         return Response(serializer.data, status=200)
 
 class StoryScriptView(APIView):
@@ -565,6 +516,54 @@ class StoryScriptView(APIView):
         serializer = StoryScriptSerializer(pages, many=True)
         return Response(serializer.data, status=200)
 
+class NarrationGenerateView(APIView):
+    """
+    동화 전체 페이지 낭독 작업 등록 (동화에 연결된 목소리로 변환)
+    POST /api/story/<story_id>/narration/
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, story_id):
+        # 본인 동화만 낭독 작업 등록 가능
+        story = Story.objects.filter(id=story_id, user=request.user).first()
+        if not story:
+            return Response({"detail": "Story not found"}, status=404)
+
+        try:
+            speed = float(request.data.get("speed", 1.0))
+        except (TypeError, ValueError):
+            return Response({"error": "speed는 숫자여야 합니다."}, status=400)
+
+        total_pages = story.pages.count()
+        if total_pages == 0:
+            return Response({"detail": "No pages in story"}, status=400)
+
+        job = NarrationJob.objects.create(
+            story=story,
+            voice=story.voice,
+            speed=speed,
+            total_pages=total_pages,
+        )
+        enqueue_narration_job(job.id)
+
+        return Response({"job": NarrationJobSerializer(job).data}, status=202)
+
+class NarrationJobDetailView(APIView):
+    """
+    낭독 작업 상태 + 페이지별 음성 URL
+    GET /api/story/narration/jobs/<pk>/
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        job = get_object_or_404(NarrationJob.objects.select_related("story"), pk=pk, story__user=request.user)
+        pages = list(job.story.pages.all().order_by("page_number"))
+
+        return Response({
+            "job": NarrationJobSerializer(job).data,
+            "pages": page_narrations(pages, job.voice_id, job.speed),
+        }, status=200)
+
 class StoryJsonImportView(APIView):
     """
     S3의 files/stories 폴더에서 json 파일을 읽어 Story와 StoryPage로 저장
@@ -592,20 +591,16 @@ class StoryJsonImportView(APIView):
             data = json.load(f)
 
 
-        story = Story.objects.create(
-            user = request.user,
+        pages = [p.get("text", "") for p in data.get("pages", [])]
+        story = ingest_story(
+            pages,
+            user=request.user,
             title=data.get("title", "무제 동화"),
-            content=" ".join([p.get("text", "") for p in data.get("pages", [])]),
-            page_count=len(data.get("pages", []))
+            content=" ".join(pages),
         )
 
-
-        for i, page in enumerate(data["pages"], start=1):
-            StoryPage.objects.create(story=story, page_number=i, text=page.get("text", ""))
-
         return Response({"story_id": story.id, "title": story.title}, status=201)
 
-import chardet  
 class ClassicStoryUploadView(APIView):
 
     def post(self, request):
@@ -633,15 +628,13 @@ class ClassicStoryUploadView(APIView):
             return Response({"detail": f"{filename} not found in S3"}, status=404)
 
 
+        # 앞부분 샘플로 인코딩을 판별하고 chunk 단위로 디코딩
         with default_storage.open(file_path, "rb") as f:
-            raw_bytes = f.read()
-        
-        detected = chardet.detect(raw_bytes)
-        encoding = detected.get("encoding", "utf-8")
+            raw_text = read_text(f)
 
-        raw_text = raw_bytes.decode(encoding, errors="ignore")
-
-        story = Story.objects.create(
+        # 긴 명작동화도 페이지 목록을 만들지 않고 batch 단위로 저장
+        story = ingest_story(
+            iter_pages(raw_text),
             user=request.user,
             child=None,
             voice=None,
@@ -652,18 +645,6 @@ class ClassicStoryUploadView(APIView):
             created_at=timezone.now(),
         )
 
-        pages = split_into_pages(raw_text)
-
-        for i, page_text in enumerate(pages, start=1):
-            StoryPage.objects.create(
-                story=story,
-                page_number=i,
-                text=page_text
-            )
-
-        story.page_count = len(pages)
-        story.save()
-
         return Response({
             "story_id": story.id,
             "title": story.title,